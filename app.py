@@ -1,621 +1,96 @@
+import time
+
+SCRIPT_STARTED_AT = time.perf_counter()
+
 import streamlit as st
-import streamlit.components.v1 as components
-from openai import OpenAI
+import functools
+import hashlib
+import inspect
+import ipaddress
 import json
-import pandas as pd
+import logging
+import os
+import pickle
+import queue
+import random
+import socket
+import sqlite3
+from io import BytesIO
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from urllib.parse import quote_plus
-from duckduckgo_search import DDGS
-
-
-COUNTRY_NAME_ALIASES = {
-    "일본": "japan",
-    "중국": "china",
-    "대만": "taiwan",
-    "홍콩": "hong kong",
-    "베트남": "vietnam",
-    "태국": "thailand",
-    "싱가포르": "singapore",
-    "말레이시아": "malaysia",
-    "미국": "united states",
-    "캐나다": "canada",
-    "영국": "united kingdom",
-    "프랑스": "france",
-    "독일": "germany",
-    "이탈리아": "italy",
-    "스페인": "spain",
-    "포르투갈": "portugal",
-    "네덜란드": "netherlands",
-    "크로아티아": "croatia",
-    "아이슬란드": "iceland",
-    "튀르키예": "turkey",
-    "아랍에미리트": "united arab emirates",
-    "호주": "australia",
-    "뉴질랜드": "new zealand",
-    "몽골": "mongolia",
-    "라오스": "laos",
-    "이집트": "egypt",
-    "필리핀": "philippines",
-    "인도네시아": "indonesia",
-    "인도": "india",
-    "스위스": "switzerland",
-    "오스트리아": "austria",
-    "체코": "czech republic",
-    "헝가리": "hungary",
-    "핀란드": "finland",
-    "노르웨이": "norway",
-    "덴마크": "denmark",
-    "벨기에": "belgium",
-    "아일랜드": "ireland",
-    "멕시코": "mexico",
-    "스웨덴": "sweden",
-    "폴란드": "poland",
-    "그리스": "greece",
-    "브라질": "brazil",
-    "아르헨티나": "argentina",
-    "칠레": "chile",
-    "페루": "peru",
-    "남아프리카공화국": "south africa",
-    "모로코": "morocco",
-    "카타르": "qatar",
-    "대한민국": "south korea",
-    "한국": "south korea",
-    "마카오": "macao",
-    "캄보디아": "cambodia",
-    "미얀마": "myanmar",
-    "네팔": "nepal",
-    "스리랑카": "sri lanka",
-    "우즈베키스탄": "uzbekistan",
-    "카자흐스탄": "kazakhstan",
-    "조지아": "georgia",
-}
+from types import MappingProxyType
+from urllib.parse import quote_plus, urljoin, urlsplit
+from travel_data import (
+    CITY_NAME_ALIASES,
+    COUNTRY_CLIMATE_ZONE,
+    COUNTRY_NAME_ALIASES,
+    ENTRY_REQUIREMENTS_BY_COUNTRY,
+    REGRET_CITY_SPECIFIC_RISKS,
+    REGRET_DESTINATION_TRAITS,
+    REGRET_FALLBACK_MESSAGES,
+    REGRET_KEYWORD_RULES,
+    REGRET_STYLE_MISMATCH_MESSAGES,
+    REPRESENTATIVE_FOOD_BY_DESTINATION,
+    THEMEALDB_AREA_BY_COUNTRY,
+    TRAVEL_DATA_VERSION,
+    ZONE_CLIMATE_STATS,
+)
 
-CITY_NAME_ALIASES = {
-    "도쿄": "tokyo",
-    "오사카": "osaka",
-    "교토": "kyoto",
-    "후쿠오카": "fukuoka",
-    "삿포로": "sapporo",
-    "나고야": "nagoya",
-    "베이징": "beijing",
-    "상하이": "shanghai",
-    "광저우": "guangzhou",
-    "선전": "shenzhen",
-    "타이베이": "taipei",
-    "가오슝": "kaohsiung",
-    "홍콩": "hong kong",
-    "하노이": "hanoi",
-    "호치민": "ho chi minh city",
-    "다낭": "da nang",
-    "방콕": "bangkok",
-    "푸켓": "phuket",
-    "싱가포르": "singapore",
-    "쿠알라룸푸르": "kuala lumpur",
-    "뉴욕": "new york",
-    "로스앤젤레스": "los angeles",
-    "샌프란시스코": "san francisco",
-    "밴쿠버": "vancouver",
-    "토론토": "toronto",
-    "런던": "london",
-    "파리": "paris",
-    "베를린": "berlin",
-    "로마": "rome",
-    "마드리드": "madrid",
-    "바르셀로나": "barcelona",
-    "리스본": "lisbon",
-    "암스테르담": "amsterdam",
-    "두브로브니크": "dubrovnik",
-    "레이캬비크": "reykjavik",
-    "이스탄불": "istanbul",
-    "두바이": "dubai",
-    "시드니": "sydney",
-    "멜버른": "melbourne",
-    "오클랜드": "auckland",
-    "울란바토르": "ulaanbaatar",
-    "비엔티안": "vientiane",
-    "카이로": "cairo",
-    "마닐라": "manila",
-    "세부": "cebu",
-    "발리": "bali",
-    "자카르타": "jakarta",
-    "델리": "delhi",
-    "뭄바이": "mumbai",
-    "취리히": "zurich",
-    "빈": "vienna",
-    "프라하": "prague",
-    "부다페스트": "budapest",
-    "헬싱키": "helsinki",
-    "오슬로": "oslo",
-    "코펜하겐": "copenhagen",
-    "브뤼셀": "brussels",
-    "더블린": "dublin",
-    "스톡홀름": "stockholm",
-    "바르샤바": "warsaw",
-    "아테네": "athens",
-    "멕시코시티": "mexico city",
-    "리우데자네이루": "rio de janeiro",
-    "부에노스아이레스": "buenos aires",
-    "산티아고": "santiago",
-    "리마": "lima",
-    "케이프타운": "cape town",
-    "마라케시": "marrakesh",
-    "도하": "doha",
-    "서울": "seoul",
-    "부산": "busan",
-    "제주": "jeju",
-    "마카오": "macao",
-    "프놈펜": "phnom penh",
-    "시엠립": "siem reap",
-    "양곤": "yangon",
-    "카트만두": "kathmandu",
-    "콜롬보": "colombo",
-    "타슈켄트": "tashkent",
-    "알마티": "almaty",
-    "트빌리시": "tbilisi",
-}
 
-ENTRY_REQUIREMENTS_BY_COUNTRY = {
-    "일본": {
-        "visa": "90일 이하 무비자",
-        "stay": "최대 90일 체류 가능",
-        "eta": "별도 ESTA/ETA 불필요",
-        "passport": "입국 시 유효한 전자여권 필요 (통상 6개월 이상 권장)",
-    },
-    "중국": {
-        "visa": "일반적으로 비자 필요 (경유/특정 정책 예외 가능)",
-        "stay": "비자 종류에 따라 상이",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "일반적으로 6개월 이상 유효기간 필요",
-    },
-    "대만": {
-        "visa": "90일 이하 무비자",
-        "stay": "최대 90일",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "입국 시 6개월 이상 권장",
-    },
-    "홍콩": {
-        "visa": "90일 이하 무비자",
-        "stay": "최대 90일",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "입국 시 1개월+ 체류기간을 초과하는 유효기간 권장",
-    },
-    "베트남": {
-        "visa": "45일 이하 무비자",
-        "stay": "최대 45일",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "일반적으로 6개월 이상 유효기간 필요",
-    },
-    "태국": {
-        "visa": "무비자 입국 가능",
-        "stay": "정책에 따라 60일 내외 (변동 가능)",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "일반적으로 6개월 이상 유효기간 필요",
-    },
-    "싱가포르": {
-        "visa": "90일 이하 무비자",
-        "stay": "최대 90일",
-        "eta": "전자입국신고(SG Arrival Card) 필요",
-        "passport": "입국 시 6개월 이상 유효기간 필요",
-    },
-    "말레이시아": {
-        "visa": "90일 이하 무비자",
-        "stay": "최대 90일",
-        "eta": "전자입국신고(MDAC) 필요",
-        "passport": "입국 시 6개월 이상 유효기간 필요",
-    },
-    "미국": {
-        "visa": "관광 목적 90일 이하는 ESTA 승인 시 무비자",
-        "stay": "최대 90일 (ESTA 기준)",
-        "eta": "ESTA 필수",
-        "passport": "전자여권 필요 (체류기간 동안 유효)",
-    },
-    "캐나다": {
-        "visa": "단기 체류 시 비자 면제",
-        "stay": "통상 최대 6개월",
-        "eta": "eTA 필수 (항공 입국 시)",
-        "passport": "입국 시 유효한 여권 필요",
-    },
-    "영국": {
-        "visa": "단기 방문 무비자",
-        "stay": "최대 6개월",
-        "eta": "ETA 필요",
-        "passport": "체류기간 동안 유효한 여권 필요",
-    },
-    "프랑스": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "독일": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "이탈리아": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "스페인": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "포르투갈": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "네덜란드": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "크로아티아": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "아이슬란드": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "튀르키예": {
-        "visa": "90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "입국일 기준 150일 이상 권장",
-    },
-    "아랍에미리트": {
-        "visa": "90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "일반적으로 6개월 이상 유효기간 필요",
-    },
-    "호주": {
-        "visa": "비자 필요",
-        "stay": "승인 비자 조건에 따름",
-        "eta": "ETA 또는 eVisitor 사전 신청 필요",
-        "passport": "체류기간 동안 유효한 전자여권 필요",
-    },
-    "뉴질랜드": {
-        "visa": "90일 이하 무비자",
-        "stay": "최대 90일",
-        "eta": "NZeTA 필수",
-        "passport": "출국일 기준 3개월 이상 유효기간 필요",
-    },
-    "몽골": {
-        "visa": "90일 이하 무비자",
-        "stay": "최대 90일",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "일반적으로 6개월 이상 유효기간 필요",
-    },
-    "라오스": {
-        "visa": "무비자 입국 가능",
-        "stay": "통상 30일 내외 (변동 가능)",
-        "eta": "전자비자(eVisa) 선택 가능",
-        "passport": "일반적으로 6개월 이상 유효기간 필요",
-    },
-    "이집트": {
-        "visa": "비자 필요",
-        "stay": "비자 조건에 따름",
-        "eta": "e-Visa 사전 신청 또는 도착비자 가능",
-        "passport": "일반적으로 6개월 이상 유효기간 필요",
-    },
-    "필리핀": {
-        "visa": "30일 이하 무비자",
-        "stay": "최대 30일",
-        "eta": "eTravel 등록 필요",
-        "passport": "입국일 기준 6개월 이상 유효기간 필요",
-    },
-    "인도네시아": {
-        "visa": "단기 관광 시 도착비자(VOA) 또는 e-VOA",
-        "stay": "통상 최대 30일 (연장 가능)",
-        "eta": "전자 세관신고(e-CD) 등 입국 전 절차 확인 권장",
-        "passport": "입국일 기준 6개월 이상 유효기간 필요",
-    },
-    "인도": {
-        "visa": "비자 필요",
-        "stay": "승인 비자 조건에 따름",
-        "eta": "e-Visa 사전 신청 가능",
-        "passport": "입국일 기준 6개월 이상 유효기간 필요",
-    },
-    "스위스": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "오스트리아": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "체코": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "헝가리": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "핀란드": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "노르웨이": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "덴마크": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "벨기에": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "아일랜드": {
-        "visa": "단기 방문 무비자",
-        "stay": "통상 최대 90일",
-        "eta": "향후 ETA 시행 가능, 최신 공지 확인 필요",
-        "passport": "체류기간 동안 유효한 여권 필요",
-    },
-    "멕시코": {
-        "visa": "무비자 입국 가능",
-        "stay": "통상 최대 180일 (심사관 재량)",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "체류기간 동안 유효한 여권 필요",
-    },
-    "스웨덴": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "폴란드": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "그리스": {
-        "visa": "쉥겐 90일 이하 무비자",
-        "stay": "180일 중 최대 90일",
-        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
-        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
-    },
-    "브라질": {
-        "visa": "단기 방문 무비자",
-        "stay": "최대 90일 (연장 가능 여부 별도 확인)",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "입국 시 통상 6개월 이상 유효기간 권장",
-    },
-    "아르헨티나": {
-        "visa": "90일 이하 무비자",
-        "stay": "최대 90일",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "체류기간 동안 유효한 여권 필요",
-    },
-    "칠레": {
-        "visa": "90일 이하 무비자",
-        "stay": "최대 90일",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "체류기간 이상 유효한 여권 필요",
-    },
-    "페루": {
-        "visa": "무비자 입국 가능",
-        "stay": "통상 최대 90일 (입국 심사 재량)",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "입국일 기준 6개월 이상 유효기간 권장",
-    },
-    "남아프리카공화국": {
-        "visa": "90일 이하 무비자",
-        "stay": "최대 90일",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "입국일 기준 30일 이상 + 빈 사증면 필요",
-    },
-    "모로코": {
-        "visa": "90일 이하 무비자",
-        "stay": "최대 90일",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "입국 시 통상 6개월 이상 유효기간 권장",
-    },
-    "카타르": {
-        "visa": "무비자 입국 가능 (입국 시 체류 허가)",
-        "stay": "통상 최대 30일",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "입국 시 통상 6개월 이상 유효기간 필요",
-    },
-    "대한민국": {
-        "visa": "해당 없음 (자국민)",
-        "stay": "해당 없음",
-        "eta": "해당 없음",
-        "passport": "해당 없음",
-    },
-    "마카오": {
-        "visa": "90일 이하 무비자",
-        "stay": "최대 90일",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "입국 시 통상 3개월 이상 유효기간 권장",
-    },
-    "캄보디아": {
-        "visa": "비자 필요 (e-Visa/도착비자 가능)",
-        "stay": "통상 30일",
-        "eta": "e-Arrival Card 등 사전 등록 여부 확인 권장",
-        "passport": "입국 시 6개월 이상 유효기간 필요",
-    },
-    "미얀마": {
-        "visa": "비자 필요 (전자비자 가능 여부 수시 변동)",
-        "stay": "비자 종류 및 승인 조건에 따름",
-        "eta": "전자비자(eVisa) 가능 여부 최신 공지 확인 필요",
-        "passport": "입국 시 6개월 이상 유효기간 필요",
-    },
-    "네팔": {
-        "visa": "도착비자 또는 e-Visa 가능",
-        "stay": "통상 15/30/90일 옵션",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "입국 시 6개월 이상 유효기간 권장",
-    },
-    "스리랑카": {
-        "visa": "전자여행허가(ETA) 사전 신청 필요",
-        "stay": "통상 30일",
-        "eta": "스리랑카 ETA 필요",
-        "passport": "입국 시 통상 6개월 이상 유효기간 필요",
-    },
-    "우즈베키스탄": {
-        "visa": "30일 이하 무비자",
-        "stay": "최대 30일",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "입국 시 통상 6개월 이상 유효기간 권장",
-    },
-    "카자흐스탄": {
-        "visa": "30일 이하 무비자",
-        "stay": "최대 30일",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "입국 시 통상 6개월 이상 유효기간 권장",
-    },
-    "조지아": {
-        "visa": "무비자 입국 가능",
-        "stay": "통상 최대 1년",
-        "eta": "ESTA/ETA 불필요",
-        "passport": "체류기간 동안 유효한 여권 필요",
-    },
+# 프로세스가 뜬 뒤 첫 실행(콜드 스타트)에서 폼이 보이기까지/스크립트 전체에 허용하는 시간입니다.
+SCRIPT_TIMING_BUDGETS = {
+    "first_paint": float(os.environ.get("NOREGRET_FIRST_PAINT_BUDGET_SECONDS", "0.5")),
+    "script": float(os.environ.get("NOREGRET_COLD_START_BUDGET_SECONDS", "1.5")),
 }
 
+logger = logging.getLogger("noregret_trip")
 
-REPRESENTATIVE_FOOD_BY_DESTINATION = {
-    "일본": "라멘",
-    "오사카": "타코야키",
-    "도쿄": "스시",
-    "중국": "샤오룽바오",
-    "대만": "우육면",
-    "홍콩": "딤섬",
-    "베트남": "쌀국수",
-    "태국": "팟타이",
-    "싱가포르": "칠리 크랩",
-    "미국": "바비큐",
-    "프랑스": "크루아상",
-    "이탈리아": "피자",
-    "스페인": "빠에야",
-    "튀르키예": "케밥",
-    "호주": "미트파이",
-    "멕시코": "타코",
-}
 
+class ScriptTimingMonitor:
+    """스크립트 실행 구간별 소요 시간을 프로세스 단위로 모아, 콜드 스타트가 예산을 넘으면 경고를 남깁니다."""
 
-ZONE_CLIMATE_STATS = {
-    "열대몬순": {
-        "temp": [27, 28, 29, 30, 30, 29, 29, 29, 29, 29, 28, 27],
-        "rain": [20, 30, 50, 90, 220, 180, 170, 190, 300, 240, 80, 30],
-        "rainy_season": [5, 6, 7, 8, 9, 10],
-        "typhoon_season": [],
-        "notes": "스콜성 소나기가 잦아 우산/방수 신발이 유용합니다.",
-    },
-    "동아시아해양": {
-        "temp": [6, 7, 11, 16, 21, 24, 28, 29, 25, 20, 14, 8],
-        "rain": [55, 60, 95, 120, 135, 180, 210, 190, 170, 120, 85, 55],
-        "rainy_season": [6, 7],
-        "typhoon_season": [8, 9, 10],
-        "notes": "장마/태풍 시기엔 항공·페리 지연 가능성을 감안해야 합니다.",
-    },
-    "지중해": {
-        "temp": [8, 9, 12, 16, 20, 25, 29, 29, 25, 20, 14, 10],
-        "rain": [80, 70, 60, 55, 40, 20, 8, 15, 40, 85, 95, 90],
-        "rainy_season": [11, 12, 1, 2],
-        "typhoon_season": [],
-        "notes": "여름철은 덥고 건조해 한낮 야외활동 난도가 높습니다.",
-    },
-    "온대대륙": {
-        "temp": [-1, 1, 6, 12, 18, 22, 25, 24, 19, 13, 6, 1],
-        "rain": [45, 40, 45, 55, 70, 75, 70, 65, 55, 50, 50, 45],
-        "rainy_season": [6, 7, 8],
-        "typhoon_season": [],
-        "notes": "겨울엔 결빙/한파, 여름엔 소나기 가능성을 고려하세요.",
-    },
-    "사막": {
-        "temp": [19, 21, 25, 30, 34, 36, 39, 39, 35, 31, 26, 21],
-        "rain": [15, 20, 15, 8, 3, 1, 1, 1, 1, 2, 6, 12],
-        "rainy_season": [],
-        "typhoon_season": [],
-        "notes": "한낮 폭염과 큰 일교차를 감수해야 하며 수분 보충이 중요합니다.",
-    },
-}
+    def __init__(self, budgets):
+        self._budgets = budgets
+        self._timings = {}
+        self._lock = threading.Lock()
 
+    def record(self, phase: str, seconds: float):
+        with self._lock:
+            timing = self._timings.get(phase)
+            is_cold = timing is None
+            if is_cold:
+                timing = {"cold": seconds, "last": seconds, "max": seconds, "runs": 0}
+                self._timings[phase] = timing
+            timing["runs"] += 1
+            timing["last"] = seconds
+            timing["max"] = max(timing["max"], seconds)
 
-COUNTRY_CLIMATE_ZONE = {
-    "태국": "열대몬순",
-    "베트남": "열대몬순",
-    "싱가포르": "열대몬순",
-    "말레이시아": "열대몬순",
-    "대만": "동아시아해양",
-    "일본": "동아시아해양",
-    "홍콩": "동아시아해양",
-    "중국": "온대대륙",
-    "미국": "온대대륙",
-    "캐나다": "온대대륙",
-    "영국": "온대대륙",
-    "프랑스": "지중해",
-    "이탈리아": "지중해",
-    "스페인": "지중해",
-    "포르투갈": "지중해",
-    "독일": "온대대륙",
-    "네덜란드": "온대대륙",
-    "튀르키예": "지중해",
-    "아랍에미리트": "사막",
-    "호주": "온대대륙",
-    "뉴질랜드": "온대대륙",
-}
+        budget = self._budgets.get(phase)
+        if is_cold and budget is not None and seconds > budget:
+            logger.warning("cold %s took %.0f ms (budget %.0f ms)", phase, seconds * 1000, budget * 1000)
 
+    def stats(self):
+        with self._lock:
+            return {phase: dict(timing) for phase, timing in self._timings.items()}
 
-THEMEALDB_AREA_BY_COUNTRY = {
-    "미국": "American",
-    "영국": "British",
-    "캐나다": "Canadian",
-    "중국": "Chinese",
-    "크로아티아": "Croatian",
-    "네덜란드": "Dutch",
-    "이집트": "Egyptian",
-    "프랑스": "French",
-    "인도": "Indian",
-    "아일랜드": "Irish",
-    "이탈리아": "Italian",
-    "말레이시아": "Malaysian",
-    "멕시코": "Mexican",
-    "폴란드": "Polish",
-    "포르투갈": "Portuguese",
-    "러시아": "Russian",
-    "스페인": "Spanish",
-    "태국": "Thai",
-    "튀르키예": "Turkish",
-    "우크라이나": "Ukrainian",
-    "베트남": "Vietnamese",
-    "일본": "Japanese",
-}
+
+@st.cache_resource(show_spinner=False)
+def _get_script_timing_monitor():
+    """프로세스 공용 실행 시간 기록기를 반환합니다."""
+    return ScriptTimingMonitor(SCRIPT_TIMING_BUDGETS)
+
+
+def record_script_timing(phase: str, seconds: float):
+    """이번 실행의 구간별 소요 시간을 기록합니다."""
+    _get_script_timing_monitor().record(phase, seconds)
 
 
 # 1. 페이지 설정 (유지)
@@ -703,6 +178,10 @@ if "latest_duration" not in st.session_state:
     st.session_state.latest_duration = None
 if "latest_travel_dates" not in st.session_state:
     st.session_state.latest_travel_dates = None
+if "destination_bundles" not in st.session_state:
+    st.session_state.destination_bundles = []
+if "lazy_sections_rendered" not in st.session_state:
+    st.session_state.lazy_sections_rendered = set()
 if "chat_open" not in st.session_state:
     st.session_state.chat_open = False
 if "chat_messages" not in st.session_state:
@@ -714,17 +193,69 @@ if "chat_messages" not in st.session_state:
     ]
 
 
-def get_followup_recommendations(
-    api_key: str,
-    user_message: str,
-    destinations,
-    profile_summary: str,
-    chat_history,
-):
-    """재추천·일정·관광지 제안을 포함한 여행 챗봇 응답을 생성합니다."""
-    if not api_key:
-        return "사이드바에 OpenAI API Key를 입력하면 바로 다시 추천해 드릴 수 있어요."
+OPENAI_CLIENT_REGISTRY_MAX_SIZE = 32
+OPENAI_CLIENT_IDLE_TTL_SECONDS = 60 * 30
+
+
+class OpenAIClientRegistry:
+    """API Key 해시별로 OpenAI 클라이언트를 재사용하는 스레드 안전 저장소입니다.
+
+    모든 클라이언트가 하나의 httpx 커넥션 풀을 공유하며, 크기 상한을 넘거나
+    오래 쓰이지 않은 클라이언트부터 제거합니다. API Key 원문은 보관하지 않습니다.
+    """
 
+    def __init__(self, max_size: int, idle_ttl_seconds: float):
+        self._max_size = max_size
+        self._idle_ttl_seconds = idle_ttl_seconds
+        self._clients = OrderedDict()
+        self._lock = threading.Lock()
+        self._http_client = None
+
+    def get(self, api_key: str):
+        key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+        now = time.monotonic()
+
+        # openai 패키지는 import 비용이 커서 실제로 클라이언트가 필요할 때 처음 불러옵니다.
+        from openai import DefaultHttpxClient, OpenAI
+
+        with self._lock:
+            self._evict_idle(now)
+            if self._http_client is None:
+                self._http_client = DefaultHttpxClient()
+            entry = self._clients.pop(key_hash, None)
+            client = entry[0] if entry else OpenAI(api_key=api_key, http_client=self._http_client)
+            self._clients[key_hash] = (client, now)
+
+            while len(self._clients) > self._max_size:
+                self._clients.popitem(last=False)
+
+        return client
+
+    def _evict_idle(self, now: float):
+        # 공유 커넥션 풀을 닫지 않도록 제거된 클라이언트에는 close()를 호출하지 않습니다.
+        while self._clients:
+            _, (_, last_used) = next(iter(self._clients.items()))
+            if now - last_used < self._idle_ttl_seconds:
+                break
+            self._clients.popitem(last=False)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_openai_client_registry():
+    """프로세스 공용 OpenAI 클라이언트 저장소를 반환합니다."""
+    return OpenAIClientRegistry(OPENAI_CLIENT_REGISTRY_MAX_SIZE, OPENAI_CLIENT_IDLE_TTL_SECONDS)
+
+
+def get_openai_client(api_key: str):
+    """API Key에 해당하는 OpenAI 클라이언트를 재사용하거나 새로 만듭니다."""
+    return _get_openai_client_registry().get(api_key)
+
+
+FOLLOWUP_MISSING_API_KEY_MESSAGE = "사이드바에 OpenAI API Key를 입력하면 바로 다시 추천해 드릴 수 있어요."
+
+
+def _build_followup_messages(user_message: str, destinations, profile_summary: str, chat_history):
+    """여행 챗봇 요청에 보낼 시스템 지시문과 대화 기록을 구성합니다."""
     destination_summary_lines = []
     for idx, destination in enumerate(destinations[:3], start=1):
         name = destination.get("name_kr", "이름 미상")
@@ -739,7 +270,6 @@ def get_followup_recommendations(
 
     destination_summary = "\n".join(destination_summary_lines) or "- 아직 추천 결과 없음"
 
-    client = OpenAI(api_key=api_key)
     conversation_history = [
         {
             "role": message.get("role", "user"),
@@ -752,35 +282,55 @@ def get_followup_recommendations(
     if not conversation_history or conversation_history[-1].get("content") != user_message:
         conversation_history.append({"role": "user", "content": user_message})
 
-    response = client.chat.completions.create(
+    return [
+        {
+            "role": "system",
+            "content": (
+                "당신은 여행 도우미 챗봇입니다. "
+                "사용자의 의도를 먼저 파악해 아래 원칙으로 한국어로 답하세요. "
+                "1) 추천이 마음에 들지 않는다고 하면 공감 1문장 + 대체 여행지 2곳을 불릿으로 짧게 제안. "
+                "2) 추천이 마음에 들어 일정/관광지 요청을 하면 사용자의 요구를 반영한 일정 또는 관광지 리스트를 불릿으로 제안. "
+                "3) 정보가 부족하면 최대 2개의 짧은 확인 질문을 먼저 제시. "
+                "4) 이전 대화 맥락을 기억해 자연스럽게 이어서 답하고, 사용자가 정정하면 최신 요청을 우선 반영. "
+                "5) 앱이 직전에 추천한 여행지 정보를 우선 참고해 대화하세요. "
+                "과도한 설명은 줄이고 바로 실행 가능한 제안을 중심으로 답하세요."
+            ),
+        },
+        {
+            "role": "system",
+            "content": (
+                f"[사용자 여행 프로필]\n{profile_summary}\n\n"
+                f"[앱의 직전 추천 여행지 상세]\n{destination_summary}"
+            ),
+        },
+        *conversation_history,
+    ]
+
+
+def stream_followup_recommendations(
+    api_key: str,
+    user_message: str,
+    destinations,
+    profile_summary: str,
+    chat_history,
+):
+    """여행 챗봇 응답을 토큰이 도착하는 대로 조각 단위로 내보냅니다."""
+    if not api_key:
+        yield FOLLOWUP_MISSING_API_KEY_MESSAGE
+        return
+
+    client = get_openai_client(api_key)
+    response_stream = client.chat.completions.create(
         model="gpt-4o-mini",
         temperature=0.8,
-        messages=[
-            {
-                "role": "system",
-                "content": (
-                    "당신은 여행 도우미 챗봇입니다. "
-                    "사용자의 의도를 먼저 파악해 아래 원칙으로 한국어로 답하세요. "
-                    "1) 추천이 마음에 들지 않는다고 하면 공감 1문장 + 대체 여행지 2곳을 불릿으로 짧게 제안. "
-                    "2) 추천이 마음에 들어 일정/관광지 요청을 하면 사용자의 요구를 반영한 일정 또는 관광지 리스트를 불릿으로 제안. "
-                    "3) 정보가 부족하면 최대 2개의 짧은 확인 질문을 먼저 제시. "
-                    "4) 이전 대화 맥락을 기억해 자연스럽게 이어서 답하고, 사용자가 정정하면 최신 요청을 우선 반영. "
-                    "5) 앱이 직전에 추천한 여행지 정보를 우선 참고해 대화하세요. "
-                    "과도한 설명은 줄이고 바로 실행 가능한 제안을 중심으로 답하세요."
-                ),
-            },
-            {
-                "role": "system",
-                "content": (
-                    f"[사용자 여행 프로필]\n{profile_summary}\n\n"
-                    f"[앱의 직전 추천 여행지 상세]\n{destination_summary}"
-                ),
-            },
-            *conversation_history,
-        ],
+        messages=_build_followup_messages(user_message, destinations, profile_summary, chat_history),
+        stream=True,
     )
 
-    return response.choices[0].message.content
+    for chunk in response_stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            yield delta
 
 
 st.markdown('<div class="cloud-chat-helper">내가 도와줄게...</div>', unsafe_allow_html=True)
@@ -815,12 +365,922 @@ def extract_place_name(name_kr: str):
     return place
 
 
+UPSTREAM_CONCURRENCY_LIMITS = {
+    "ddgs": 4,
+    "teleport": 6,
+    "openweather": 6,
+    "themealdb": 4,
+    "youtube": 8,
+    "images": 8,
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _get_upstream_semaphores():
+    """외부 서비스별 동시 호출 수를 제한하는 프로세스 공용 세마포어를 반환합니다."""
+    return {
+        upstream: threading.BoundedSemaphore(limit)
+        for upstream, limit in UPSTREAM_CONCURRENCY_LIMITS.items()
+    }
+
+
+@contextmanager
+def upstream_slot(upstream: str):
+    """지정한 외부 서비스의 동시 호출 슬롯을 하나 점유합니다."""
+    semaphore = _get_upstream_semaphores().get(upstream)
+    if semaphore is None:
+        yield
+        return
+
+    with semaphore:
+        yield
+
+
+CIRCUIT_BREAKER_WINDOW = 10
+CIRCUIT_BREAKER_MIN_CALLS = 4
+CIRCUIT_BREAKER_ERROR_RATE = 0.5
+CIRCUIT_BREAKER_SLOW_CALL_SECONDS = 6.0
+CIRCUIT_BREAKER_OPEN_SECONDS = 30.0
+# 원격 이미지처럼 호스트마다 차단기를 두는 경우를 위해, 보관하는 차단기 수에 상한을 둡니다.
+CIRCUIT_BREAKER_MAX_ENTRIES = 256
+
+
+class CircuitOpenError(requests.RequestException):
+    """차단기가 열려 있어 외부 서비스 호출을 건너뛰었음을 나타냅니다.
+
+    requests.RequestException을 상속하므로 기존 조회 함수의 예외 처리에서 그대로 대체값을 반환합니다.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(f"{name} 서비스 응답이 불안정해 잠시 조회를 건너뛰었어요.")
+        self.name = name
+
+
+class CircuitBreaker:
+    """외부 서비스 1곳의 최근 호출 결과로 닫힘/열림/반열림 상태를 관리하는 차단기입니다.
+
+    최근 호출 중 실패 또는 느린 호출의 비율이 기준을 넘으면 열려서 호출을 즉시 거절하고,
+    open_seconds가 지나면 반열림 상태로 시험 호출 1건만 통과시켜 회복 여부를 확인합니다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, window: int, min_calls: int, error_rate: float, slow_call_seconds: float, open_seconds: float):
+        self.name = name
+        self._min_calls = min_calls
+        self._error_rate = error_rate
+        self._slow_call_seconds = slow_call_seconds
+        self._open_seconds = open_seconds
+        self._outcomes = deque(maxlen=window)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        return self._state
+
+    def allow(self):
+        """이번 호출을 보내도 되는지 반환합니다. 반열림 상태에서는 시험 호출 1건만 허용합니다."""
+        with self._lock:
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self._open_seconds:
+                    return False
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            if self._state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    return False
+                self._probe_in_flight = True
+
+            return True
+
+    def record(self, success: bool, latency: float):
+        """호출 결과를 기록하고 필요하면 상태를 바꿉니다."""
+        failed = not success or latency >= self._slow_call_seconds
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._probe_in_flight = False
+                if failed:
+                    self._trip()
+                else:
+                    self._state = self.CLOSED
+                    self._outcomes.clear()
+                return
+
+            self._outcomes.append(failed)
+            if (
+                self._state == self.CLOSED
+                and len(self._outcomes) >= self._min_calls
+                and sum(self._outcomes) / len(self._outcomes) >= self._error_rate
+            ):
+                self._trip()
+
+    def _trip(self):
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+
+class CircuitBreakerRegistry:
+    """외부 서비스 이름별 차단기를 만들어 두고 공유합니다.
+
+    max_entries를 넘으면 가장 오래 쓰지 않은 닫힌 차단기부터 지우며, 닫힌 차단기가 없으면 가장 오래된 것을 지웁니다.
+    """
+
+    def __init__(self, max_entries: int = CIRCUIT_BREAKER_MAX_ENTRIES):
+        self._breakers = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def _evict(self):
+        while len(self._breakers) > self._max_entries:
+            victim = next(
+                (name for name, breaker in self._breakers.items() if breaker.state == CircuitBreaker.CLOSED),
+                next(iter(self._breakers)),
+            )
+            del self._breakers[victim]
+
+    def get(self, name: str, slow_call_seconds: float = CIRCUIT_BREAKER_SLOW_CALL_SECONDS):
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is not None:
+                self._breakers.move_to_end(name)
+            else:
+                breaker = CircuitBreaker(
+                    name,
+                    CIRCUIT_BREAKER_WINDOW,
+                    CIRCUIT_BREAKER_MIN_CALLS,
+                    CIRCUIT_BREAKER_ERROR_RATE,
+                    slow_call_seconds,
+                    CIRCUIT_BREAKER_OPEN_SECONDS,
+                )
+                self._breakers[name] = breaker
+                self._evict()
+            return breaker
+
+    def states(self):
+        with self._lock:
+            return {name: breaker.state for name, breaker in self._breakers.items()}
+
+
+@st.cache_resource(show_spinner=False)
+def _get_circuit_breakers():
+    """프로세스 공용 차단기 저장소를 반환합니다."""
+    return CircuitBreakerRegistry()
+
+
+@contextmanager
+def circuit_breaker_guard(breaker: CircuitBreaker):
+    """차단기가 열려 있으면 CircuitOpenError를 던지고, 아니면 블록의 성공/실패와 소요 시간을 기록합니다.
+
+    블록 안에서 outcome["success"]를 False로 바꾸면 예외 없이 끝난 호출도 실패로 기록합니다.
+    동시 호출 슬롯처럼 로컬 대기가 끝난 뒤 outcome["started_at"]을 다시 찍으면 실제 호출 시간만 잽니다.
+    """
+    if not breaker.allow():
+        raise CircuitOpenError(breaker.name)
+
+    outcome = {"success": True, "started_at": time.monotonic()}
+    try:
+        yield outcome
+    except Exception:
+        breaker.record(False, time.monotonic() - outcome["started_at"])
+        raise
+    breaker.record(outcome["success"], time.monotonic() - outcome["started_at"])
+
+
+DDGS_RATE_PER_SECOND = 1.0
+DDGS_BURST = 3
+DDGS_MAX_RETRIES = 3
+DDGS_BACKOFF_BASE_SECONDS = 1.0
+DDGS_BACKOFF_MAX_SECONDS = 16.0
+DDGS_RESULT_TIMEOUT_SECONDS = 30.0
+DDGS_PRIORITY_VISIBLE = 0
+DDGS_PRIORITY_LAZY = 1
+
+
+class DDGSBroker:
+    """DuckDuckGo 검색을 프로세스 전체에서 한 곳으로 모아 보내는 중개자입니다.
+
+    토큰 버킷으로 초당 요청 수를 제한하고, 우선순위 큐로 화면에 바로 보이는 섹션의 검색을 먼저 처리합니다.
+    작업 스레드마다 DDGS 클라이언트를 하나씩 두고 재사용하며, 요청 한도 초과 응답을 받으면
+    모든 작업 스레드가 지수적으로 늘어나는 대기 시간만큼 쉬었다가 다시 시도합니다.
+    """
+
+    def __init__(self, workers: int, rate_per_second: float, burst: int):
+        self._rate_per_second = rate_per_second
+        self._burst = burst
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._queue = queue.PriorityQueue()
+        self._sequence = 0
+        for index in range(workers):
+            threading.Thread(target=self._work, name=f"ddgs-broker-{index}", daemon=True).start()
+
+    def search(self, method: str, priority: int = DDGS_PRIORITY_VISIBLE, **kwargs):
+        """DDGS의 text/images 등 검색 메서드를 대기열을 거쳐 실행하고 결과 목록을 반환합니다.
+
+        차단기 확인과 결과 기록은 작업 스레드가 실제 호출 직전/직후에 짝지어 처리합니다.
+        """
+        future = Future()
+        with self._lock:
+            self._sequence += 1
+            self._queue.put((priority, self._sequence, method, kwargs, future))
+        try:
+            return future.result(timeout=DDGS_RESULT_TIMEOUT_SECONDS)
+        except FuturesTimeoutError:
+            future.cancel()
+            raise
+
+    def _acquire_token(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._burst, self._tokens + (now - self._refilled_at) * self._rate_per_second)
+                self._refilled_at = now
+                wait_seconds = max(0.0, self._paused_until - now)
+                if not wait_seconds and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                if not wait_seconds:
+                    wait_seconds = (1 - self._tokens) / self._rate_per_second
+            time.sleep(wait_seconds)
+
+    def _back_off(self, attempt: int):
+        delay = min(DDGS_BACKOFF_MAX_SECONDS, DDGS_BACKOFF_BASE_SECONDS * (2 ** attempt))
+        delay += random.uniform(0, delay / 2)
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+    def _work(self):
+        from duckduckgo_search import DDGS
+        from duckduckgo_search.exceptions import RatelimitException
+
+        client = None
+        breaker = _get_circuit_breakers().get("ddgs")
+        while True:
+            _, _, method, kwargs, future = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            # 취소된 요청은 차단기를 건드리지 않도록, allow()는 실행이 확정된 요청에만 호출합니다.
+            if not breaker.allow():
+                future.set_exception(CircuitOpenError("ddgs"))
+                continue
+
+            # allow() 뒤에는 어떤 경로로 끝나든 record()를 한 번 호출해야 반열림 시험 호출 자리가 풀립니다.
+            # 어떤 예외가 나도 작업 스레드는 살아남아야 대기 중인 호출자가 영원히 막히지 않습니다.
+            recorded = False
+            try:
+                if client is None:
+                    client = DDGS()
+                for attempt in range(DDGS_MAX_RETRIES + 1):
+                    # 토큰 대기와 재시도 대기는 빼고 실제 검색 호출 시간만 차단기에 기록합니다.
+                    self._acquire_token()
+                    started_at = time.monotonic()
+                    try:
+                        result = list(getattr(client, method)(**kwargs))
+                    except RatelimitException as error:
+                        if attempt == DDGS_MAX_RETRIES:
+                            recorded = True
+                            breaker.record(False, time.monotonic() - started_at)
+                            future.set_exception(error)
+                            break
+                        self._back_off(attempt)
+                    except Exception as error:
+                        recorded = True
+                        breaker.record(False, time.monotonic() - started_at)
+                        future.set_exception(error)
+                        client = None
+                        break
+                    else:
+                        recorded = True
+                        breaker.record(True, time.monotonic() - started_at)
+                        future.set_result(result)
+                        break
+            except Exception as error:
+                client = None
+                if not recorded:
+                    breaker.record(False, 0.0)
+                if not future.done():
+                    future.set_exception(error)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_ddgs_broker():
+    """프로세스 공용 DuckDuckGo 검색 중개자를 반환합니다."""
+    return DDGSBroker(UPSTREAM_CONCURRENCY_LIMITS["ddgs"], DDGS_RATE_PER_SECOND, DDGS_BURST)
+
+
+def ddgs_search(method: str, priority: int = DDGS_PRIORITY_VISIBLE, **kwargs):
+    """공용 중개자를 통해 DuckDuckGo 검색을 실행합니다."""
+    return _get_ddgs_broker().search(method, priority=priority, **kwargs)
+
+
+UPSTREAM_HTTP_POLICIES = {
+    "wikipedia": {"hosts": ["https://ko.wikipedia.org"], "pool_size": 8, "retries": 1, "timeout": 8},
+    "unsplash": {
+        "hosts": ["https://source.unsplash.com", "https://images.unsplash.com"],
+        "pool_size": 8,
+        "retries": 0,
+        "timeout": 8,
+    },
+    "teleport": {"hosts": ["https://api.teleport.org"], "pool_size": 6, "retries": 2, "timeout": 12},
+    "openweather": {"hosts": ["https://api.openweathermap.org"], "pool_size": 6, "retries": 2, "timeout": 12},
+    "themealdb": {"hosts": ["https://www.themealdb.com"], "pool_size": 4, "retries": 2, "timeout": 8},
+    "youtube": {"hosts": ["https://www.youtube.com"], "pool_size": 8, "retries": 0, "timeout": 4},
+    "images": {"hosts": [], "pool_size": 8, "retries": 1, "timeout": 10},
+}
+
+# 고정 호스트가 없는 요청(원격 이미지, 기타 호스트)은 기본 어댑터를 함께 쓰므로,
+# 호스트별 풀을 여러 개 유지해야 새 호스트가 올 때마다 기존 풀이 밀려나지 않습니다.
+DEFAULT_HTTP_POLICY = {"pool_size": 10, "retries": 1, "timeout": 10, "host_pools": 32}
+
+HTTP_TRANSFER_LOG_SIZE = 256
+
+
+def _build_http_adapter(policy):
+    retry = Retry(
+        total=policy["retries"],
+        connect=policy["retries"],
+        read=policy["retries"],
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=policy.get("host_pools", 1),
+        pool_maxsize=policy["pool_size"],
+        max_retries=retry,
+    )
+
+
+class PooledHttpClient:
+    """외부 서비스별 keep-alive 커넥션 풀을 프로세스 전체에서 공유하는 HTTP 클라이언트입니다.
+
+    requests.Session은 스레드 간 공유가 보장되지 않으므로 스레드마다 세션을 두되,
+    실제 커넥션 풀을 가진 HTTPAdapter는 모든 세션이 함께 사용합니다.
+    """
+
+    def __init__(self, policies, default_policy):
+        self._policies = policies
+        self._default_policy = default_policy
+        self._default_adapter = _build_http_adapter(default_policy)
+        self._host_adapters = [
+            (host, _build_http_adapter(policy))
+            for policy in policies.values()
+            for host in policy["hosts"]
+        ]
+        self._local = threading.local()
+        self._transfer_lock = threading.Lock()
+        self._transfer_totals = {}
+        self._transfer_log = deque(maxlen=HTTP_TRANSFER_LOG_SIZE)
+
+    def _session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self._default_adapter)
+            session.mount("http://", self._default_adapter)
+            for host, adapter in self._host_adapters:
+                session.mount(host, adapter)
+            self._local.session = session
+        return session
+
+    def _record_transfer(self, upstream: str, method: str, response, body_bytes: int):
+        header_bytes = sum(len(name) + len(value) + 4 for name, value in response.headers.items())
+        redirect_hops = len(response.history)
+        with self._transfer_lock:
+            totals = self._transfer_totals.setdefault(upstream, {"calls": 0, "bytes": 0})
+            totals["calls"] += 1
+            totals["bytes"] += header_bytes + body_bytes
+            self._transfer_log.append(
+                {
+                    "upstream": upstream,
+                    "method": method,
+                    "status": response.status_code,
+                    "redirects": redirect_hops,
+                    "header_bytes": header_bytes,
+                    "body_bytes": body_bytes,
+                    "elapsed": response.elapsed.total_seconds(),
+                }
+            )
+
+    def _breaker(self, upstream: str, url: str):
+        # 고정된 호스트가 없는 서비스(원격 이미지 등)는 호스트마다 차단기를 따로 둡니다.
+        policy = self._policies.get(upstream, self._default_policy)
+        name = upstream if policy.get("hosts") else f"{upstream}:{urlsplit(url).netloc}"
+        return _get_circuit_breakers().get(name, min(CIRCUIT_BREAKER_SLOW_CALL_SECONDS, policy["timeout"] * 0.75))
+
+    def get(self, upstream: str, url: str, **kwargs):
+        policy = self._policies.get(upstream, self._default_policy)
+        kwargs.setdefault("timeout", policy["timeout"])
+        with circuit_breaker_guard(self._breaker(upstream, url)) as outcome, upstream_slot(upstream):
+            outcome["started_at"] = time.monotonic()
+            response = self._session().get(url, **kwargs)
+            outcome["success"] = response.status_code < 500 and response.status_code != 429
+        if kwargs.get("stream"):
+            self._record_transfer_on_close(upstream, response)
+        else:
+            self._record_transfer(upstream, "GET", response, len(response.content or b""))
+        return response
+
+    def _record_transfer_on_close(self, upstream: str, response):
+        """스트리밍 응답은 호출한 쪽이 본문을 읽고 닫을 때, 실제로 받은 본문 바이트 수로 전송량을 기록합니다."""
+        close = response.close
+        recorded = False
+
+        def close_and_record():
+            nonlocal recorded
+            if not recorded:
+                recorded = True
+                raw = getattr(response, "raw", None)
+                self._record_transfer(upstream, "GET", response, raw.tell() if raw is not None else 0)
+            close()
+
+        response.close = close_and_record
+
+    def resolve_url(self, upstream: str, url: str, **kwargs):
+        """리다이렉트를 따라간 최종 URL을 본문을 내려받지 않고 반환합니다.
+
+        HEAD를 먼저 시도하고, HEAD를 거부하는 서버에는 스트리밍 GET을 보낸 뒤 본문을 읽기 전에 닫습니다.
+        """
+        policy = self._policies.get(upstream, self._default_policy)
+        kwargs.setdefault("timeout", policy["timeout"])
+        with circuit_breaker_guard(self._breaker(upstream, url)) as outcome, upstream_slot(upstream):
+            outcome["started_at"] = time.monotonic()
+            response = self._session().head(url, allow_redirects=True, **kwargs)
+            self._record_transfer(upstream, "HEAD", response, 0)
+            if response.status_code in (403, 405, 501):
+                with self._session().get(url, allow_redirects=True, stream=True, **kwargs) as response:
+                    self._record_transfer(upstream, "GET", response, 0)
+
+            outcome["success"] = response.status_code < 500 and response.status_code != 429
+            return response
+
+    def transfer_stats(self):
+        """외부 서비스별 누적 호출 수/전송 바이트와 최근 호출 기록을 반환합니다."""
+        with self._transfer_lock:
+            return {
+                "totals": {upstream: dict(totals) for upstream, totals in self._transfer_totals.items()},
+                "recent": list(self._transfer_log),
+            }
+
+
+@st.cache_resource(show_spinner=False)
+def _get_http_client():
+    """프로세스 공용 HTTP 클라이언트를 반환합니다."""
+    return PooledHttpClient(UPSTREAM_HTTP_POLICIES, DEFAULT_HTTP_POLICY)
+
+
+def upstream_get(upstream: str, url: str, **kwargs):
+    """공용 커넥션 풀과 외부 서비스별 재시도/타임아웃/동시 호출 한도로 GET 요청을 보냅니다."""
+    return _get_http_client().get(upstream, url, **kwargs)
+
+
+def upstream_resolve_url(upstream: str, url: str, **kwargs):
+    """본문 없이 리다이렉트만 따라가 최종 응답(상태 코드/URL)을 반환합니다."""
+    return _get_http_client().resolve_url(upstream, url, **kwargs)
+
+
+FANOUT_MAX_WORKERS = 16
+
+
+@st.cache_resource(show_spinner=False)
+def _get_fanout_executor():
+    """후보 여러 개를 동시에 조회할 때 쓰는 프로세스 공용 스레드 풀을 반환합니다.
+
+    부가 정보 조회 작업 안에서 다시 작업을 나눠 기다리므로, 교착을 피하려고 별도 풀을 둡니다.
+    """
+    return ThreadPoolExecutor(max_workers=FANOUT_MAX_WORKERS, thread_name_prefix="fanout")
+
+
+def first_accepted_by_priority(calls, accept=bool, hedge_delay: float = 0.0, max_in_flight=None):
+    """우선순위 순서의 (라벨, 호출) 목록을 동시에 실행해 가장 우선순위가 높은 성공 결과를 반환합니다.
+
+    앞선 후보가 모두 실패로 끝나는 즉시 다음 성공 결과를 채택하고, 아직 시작하지 않은 작업은 취소합니다.
+    hedge_delay가 0보다 크면 후보를 그 간격만큼 늦춰 순서대로 시작하되, 앞선 후보가 모두 실패하면 바로 다음 후보를 시작합니다.
+    max_in_flight를 주면 진행 중인 후보를 그 수 이하로 유지해, 앞선 후보가 끝나야 다음 후보를 시작합니다.
+    성공한 후보가 없으면 (None, None)을 반환합니다.
+    """
+    executor = _get_fanout_executor()
+    futures = []
+    next_launch_at = time.monotonic()
+    in_flight_limit = len(calls) if max_in_flight is None else max(1, max_in_flight)
+
+    def launch_next():
+        nonlocal next_launch_at
+        futures.append(executor.submit(calls[len(futures)][1]))
+        next_launch_at = time.monotonic() + hedge_delay
+
+    def can_launch():
+        return len(futures) < len(calls) and sum(not future.done() for future in futures) < in_flight_limit
+
+    launch_next()
+    if hedge_delay <= 0:
+        while can_launch():
+            launch_next()
+
+    settled = 0
+    try:
+        while settled < len(calls):
+            while settled < len(futures) and futures[settled].done():
+                future = futures[settled]
+                settled += 1
+                if future.exception() is None and accept(future.result()):
+                    return calls[settled - 1][0], future.result()
+
+            if settled == len(calls):
+                break
+            if settled == len(futures):
+                launch_next()
+                continue
+            if hedge_delay <= 0 and can_launch():
+                launch_next()
+                continue
+
+            timeout = None
+            if can_launch():
+                timeout = max(0.0, next_launch_at - time.monotonic())
+            # 이미 끝난 뒤 순위 후보를 넘기면 wait가 바로 반환되어 바쁜 대기가 되므로, 진행 중인 작업만 기다립니다.
+            wait([future for future in futures[settled:] if not future.done()], timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if can_launch() and time.monotonic() >= next_launch_at:
+                launch_next()
+    finally:
+        for future in futures:
+            future.cancel()
+
+    return None, None
+
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+PERSISTENT_CACHE_DIR = os.environ.get("NOREGRET_CACHE_DIR", os.path.join(APP_DIR, ".cache"))
+PERSISTENT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+PERSISTENT_CACHE_VERSION = 1
+NEGATIVE_CACHE_TTL = 60 * 10
+
+
+class PersistentCache:
+    """배포/재시작 후에도 유지되는 SQLite 기반 로컬 캐시입니다.
+
+    항목마다 만료 시각을 저장하고, 전체 크기가 상한을 넘으면 가장 오래 조회되지 않은 항목부터 지웁니다.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, namespace TEXT NOT NULL, value BLOB NOT NULL, "
+            "size INTEGER NOT NULL, expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_entries_last_access ON cache_entries (last_access)"
+        )
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+
+    def get(self, key: str):
+        """(적중 여부, 값)을 반환합니다. 만료된 항목은 지우고 미적중으로 처리합니다."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, size, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return False, None
+
+            value, size, expires_at = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                self._total_bytes -= size
+                return False, None
+
+            self._conn.execute("UPDATE cache_entries SET last_access = ? WHERE key = ?", (now, key))
+
+        return True, pickle.loads(value)
+
+    def set(self, key: str, namespace: str, value, ttl_seconds: float):
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM cache_entries WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, namespace, value, size, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, namespace, payload, len(payload), now + ttl_seconds, now),
+            )
+            self._total_bytes += len(payload) - (previous[0] if previous else 0)
+            self._evict()
+
+    def _evict(self):
+        if self._total_bytes <= self._max_bytes:
+            return
+
+        self._conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),))
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+
+        while self._total_bytes > self._max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM cache_entries ORDER BY last_access LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            self._conn.executemany("DELETE FROM cache_entries WHERE key = ?", [(key,) for key, _ in rows])
+            self._total_bytes -= sum(size for _, size in rows)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_persistent_cache():
+    """프로세스 공용 디스크 캐시를 반환합니다."""
+    return PersistentCache(os.path.join(PERSISTENT_CACHE_DIR, "noregret_cache.sqlite3"), PERSISTENT_CACHE_MAX_BYTES)
+
+
+def _cache_key_repr(signature, args, kwargs):
+    """밑줄로 시작하는 인자를 뺀 호출 인자를 캐시 키용 문자열로 만듭니다."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    key_parts = sorted(
+        (name, value) for name, value in bound.arguments.items() if not name.startswith("_")
+    )
+    return repr(key_parts)
+
+
+def persistent_cache(namespace: str, ttl: float, negative_ttl: float = 0, is_negative=None):
+    """st.cache_data 아래에 두는 디스크 캐시 데코레이터입니다.
+
+    st.cache_data와 같이 밑줄로 시작하는 인자는 캐시 키에서 제외합니다.
+    is_negative로 판별한 실패/대체 결과는 negative_ttl 동안만 보관하며, 0이면 저장하지 않습니다.
+    """
+    if is_negative is None:
+        is_negative = lambda value: value is None  # noqa: E731
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            digest = hashlib.sha256(_cache_key_repr(signature, args, kwargs).encode("utf-8")).hexdigest()
+            # 정적 여행 테이블이 바뀌면 그 테이블로 만든 캐시 결과도 함께 무효화합니다.
+            key = f"v{PERSISTENT_CACHE_VERSION}.{TRAVEL_DATA_VERSION}:{namespace}:{digest}"
+
+            try:
+                hit, value = _get_persistent_cache().get(key)
+                if hit:
+                    return value
+            except (sqlite3.Error, pickle.UnpicklingError, OSError):
+                pass
+
+            value = func(*args, **kwargs)
+
+            entry_ttl = negative_ttl if is_negative(value) else ttl
+            if entry_ttl > 0:
+                try:
+                    _get_persistent_cache().set(key, namespace, value, entry_ttl)
+                except (sqlite3.Error, pickle.PicklingError, OSError):
+                    pass
+
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+class SingleFlight:
+    """같은 키의 동시 호출을 하나로 합쳐, 먼저 들어온 호출의 결과를 나머지 호출이 함께 받도록 합니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    def do(self, key: str, func):
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_single_flight():
+    """프로세스 공용 동시 호출 병합기를 반환합니다."""
+    return SingleFlight()
+
+
+def single_flight(namespace: str, key=None):
+    """st.cache_data와 persistent_cache 사이에 두는 동시 호출 병합 데코레이터입니다.
+
+    st.cache_data는 인자가 글자 그대로 같은 호출만 합쳐 주므로, key로 정규화한 키가 같은 호출까지
+    진행 중인 조회 하나를 함께 기다리게 합니다. key를 생략하면 밑줄로 시작하지 않는 인자 전체를 씁니다.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            flight_key = repr(key(*args, **kwargs)) if key else _cache_key_repr(signature, args, kwargs)
+            return _get_single_flight().do(f"{namespace}:{flight_key}", lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+THUMBNAIL_DIR = os.path.join(PERSISTENT_CACHE_DIR, "thumbnails")
+THUMBNAIL_MAX_BYTES = 128 * 1024 * 1024
+THUMBNAIL_SOURCE_MAX_BYTES = 20 * 1024 * 1024
+THUMBNAIL_QUALITY = 80
+THUMBNAIL_FAILURE_MAX_ENTRIES = 1024
+THUMBNAIL_MAX_REDIRECTS = 3
+# render_destination_results의 표시 폭(랜드마크 3열 ≒ 320px, 음식 160px)을 고해상도 화면 기준 2배로 잡았습니다.
+THUMBNAIL_WIDTHS = {"landmark": 640, "meal": 320}
+
+
+def _is_public_http_url(url: str) -> bool:
+    """http(s) URL이고 호스트가 가리키는 모든 주소가 공인 IP이면 True를 반환합니다.
+
+    서버가 검색 결과의 임의 URL을 대신 내려받으므로, 내부망/루프백/링크 로컬(메타데이터) 주소로는 요청하지 않습니다.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return False
+    try:
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        addresses = socket.getaddrinfo(parts.hostname, port, proto=socket.IPPROTO_TCP)
+    except (OSError, ValueError):
+        return False
+    return bool(addresses) and all(
+        ipaddress.ip_address(address[4][0].split("%")[0]).is_global for address in addresses
+    )
+
+
+class ThumbnailStore:
+    """원격 이미지를 한 번만 내려받아 표시 폭에 맞춘 WebP 썸네일로 디스크에 보관합니다.
+
+    파일 수정 시각을 마지막 사용 시각으로 쓰고, 전체 크기가 상한을 넘으면 오래 쓰지 않은 파일부터 지웁니다.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._failed_until = OrderedDict()
+        self._total_bytes = sum(entry.stat().st_size for entry in os.scandir(directory) if entry.is_file())
+
+    def _remember_failure(self, path: str):
+        """실패한 썸네일을 잠시 다시 시도하지 않도록 기록하고, 만료되었거나 상한을 넘은 기록은 오래된 것부터 지웁니다."""
+        now = time.time()
+        self._failed_until.pop(path, None)
+        self._failed_until[path] = now + NEGATIVE_CACHE_TTL
+        while self._failed_until and (
+            len(self._failed_until) > THUMBNAIL_FAILURE_MAX_ENTRIES or next(iter(self._failed_until.values())) <= now
+        ):
+            self._failed_until.popitem(last=False)
+
+    def _path(self, url: str, width: int):
+        digest = hashlib.sha256(f"{width}|{url}".encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, f"{digest}.webp")
+
+    def get(self, url: str, width: int):
+        """썸네일 파일 경로를 반환하며, 만들 수 없으면 None을 반환합니다."""
+        path = self._path(url, width)
+        try:
+            os.utime(path)
+            return path
+        except FileNotFoundError:
+            pass
+
+        with self._lock:
+            if self._failed_until.get(path, 0) > time.time():
+                return None
+
+        from PIL import Image, UnidentifiedImageError
+
+        try:
+            thumbnail = self._render(self._download(url), width)
+        except (requests.RequestException, UnidentifiedImageError, OSError, ValueError, Image.DecompressionBombError):
+            with self._lock:
+                self._remember_failure(path)
+            return None
+
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as temp_file:
+            temp_file.write(thumbnail)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            self._total_bytes += len(thumbnail)
+            self._evict()
+        return path
+
+    def _download(self, url: str):
+        # 리다이렉트는 직접 따라가며 매 단계 목적지 주소를 다시 확인합니다.
+        for _ in range(THUMBNAIL_MAX_REDIRECTS + 1):
+            if not _is_public_http_url(url):
+                raise ValueError("image host is not public")
+            with upstream_get("images", url, stream=True, allow_redirects=False) as response:
+                if response.is_redirect:
+                    url = urljoin(url, response.headers["location"])
+                    continue
+                response.raise_for_status()
+                chunks = []
+                received = 0
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    received += len(chunk)
+                    if received > THUMBNAIL_SOURCE_MAX_BYTES:
+                        raise ValueError("image too large")
+                    chunks.append(chunk)
+            return b"".join(chunks)
+        raise ValueError("too many redirects")
+
+    def _render(self, payload: bytes, width: int):
+        from PIL import Image, ImageOps
+
+        with Image.open(BytesIO(payload)) as image:
+            image = ImageOps.exif_transpose(image)
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+            image.thumbnail((width, width * 4), Image.LANCZOS)
+            output = BytesIO()
+            image.save(output, format="WEBP", quality=THUMBNAIL_QUALITY, method=4)
+        return output.getvalue()
+
+    def _evict(self):
+        if self._total_bytes <= self._max_bytes:
+            return
+
+        entries = sorted(
+            (entry for entry in os.scandir(self._directory) if entry.is_file()),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        self._total_bytes = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if self._total_bytes <= self._max_bytes:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                self._total_bytes -= size
+            except FileNotFoundError:
+                continue
+
+
+@st.cache_resource(show_spinner=False)
+def _get_thumbnail_store():
+    """프로세스 공용 썸네일 저장소를 반환합니다."""
+    return ThumbnailStore(THUMBNAIL_DIR, THUMBNAIL_MAX_BYTES)
+
+
+def get_display_image(url: str, kind: str):
+    """표시 용도에 맞게 줄인 로컬 썸네일 경로를 반환하고, 실패하면 원본 URL을 그대로 반환합니다."""
+    if not url or not url.startswith(("http://", "https://")):
+        return url
+    try:
+        return _get_thumbnail_store().get(url, THUMBNAIL_WIDTHS[kind]) or url
+    except OSError:
+        return url
+
+
+def get_display_images(urls, kind: str):
+    """여러 이미지의 썸네일을 동시에 준비해 같은 순서로 반환합니다."""
+    return list(_get_fanout_executor().map(functools.partial(get_display_image, kind=kind), urls))
+
+
 def _get_wikipedia_image(query: str):
     """Wikipedia 요약 API를 이용해 대표 이미지를 보조 조회합니다."""
     for keyword in _extract_destination_keywords(query):
         try:
             endpoint = f"https://ko.wikipedia.org/api/rest_v1/page/summary/{keyword}"
-            res = requests.get(endpoint, timeout=8)
+            res = upstream_get("wikipedia", endpoint)
             if res.status_code != 200:
                 continue
             data = res.json()
@@ -833,98 +1293,122 @@ def _get_wikipedia_image(query: str):
     return None
 
 
+@st.cache_data(show_spinner=False, ttl=60 * 60 * 12)
+@single_flight("unsplash_redirect", key=lambda keyword: " ".join(keyword.split()).lower())
+@persistent_cache("unsplash_redirect", ttl=60 * 60 * 12, negative_ttl=NEGATIVE_CACHE_TTL)
+def _resolve_unsplash_image(keyword: str):
+    """Unsplash Source 검색 URL이 리다이렉트되는 실제 이미지 URL을 이미지 본문 없이 조회합니다."""
+    try:
+        encoded_query = requests.utils.quote(keyword)
+        candidate_url = f"https://source.unsplash.com/1600x900/?{encoded_query}"
+        response = upstream_resolve_url("unsplash", candidate_url)
+        response.raise_for_status()
+        if "images.unsplash.com" in response.url:
+            return response.url
+    except requests.RequestException:
+        pass
+    return None
+
+
 def _get_unsplash_image(query: str):
     """Unsplash Source URL을 이용해 검색어 기반 이미지를 반환합니다."""
-    keywords = _extract_destination_keywords(query)
-
-    for keyword in keywords:
-        try:
-            encoded_query = requests.utils.quote(keyword)
-            candidate_url = f"https://source.unsplash.com/1600x900/?{encoded_query}"
-            response = requests.get(candidate_url, timeout=8, allow_redirects=True)
-            response.raise_for_status()
-            if "images.unsplash.com" in response.url:
-                return response.url
-        except requests.RequestException:
-            continue
+    for keyword in _extract_destination_keywords(query):
+        image_url = _resolve_unsplash_image(keyword)
+        if image_url:
+            return image_url
 
     return None
 
 
-@st.cache_data(show_spinner=False, ttl=60 * 60 * 12)
-def get_landmark_image(query: str):
-    """Unsplash + DuckDuckGo + Wikipedia 순으로 대표 이미지를 가져옵니다."""
-    unsplash_image = _get_unsplash_image(f"{query} landmark")
-    if unsplash_image:
-        return unsplash_image, None
-
-    try:
-        with DDGS() as ddgs:
-            results = list(
-                ddgs.images(
-                    keywords=f"{query} landmark",
-                    region="kr-kr",
-                    safesearch="moderate",
-                    size="Large",
-                    max_results=1,
-                )
-            )
+LANDMARK_CANDIDATE_LIMIT = 8
+IMAGE_HEDGE_DELAY = 0.3
 
-        if results:
-            image_url = (
-                results[0].get("image")
-                or results[0].get("thumbnail")
-                or results[0].get("url")
-            )
-            if image_url:
-                return image_url, None
 
-        wiki_image = _get_wikipedia_image(query)
-        if wiki_image:
-            return wiki_image, None
+def _search_ddgs_images(keywords: str, size: str, max_results: int, priority: int = DDGS_PRIORITY_VISIBLE):
+    """DuckDuckGo 이미지 검색 결과에서 사용할 이미지 URL 목록을 반환합니다."""
+    results = ddgs_search(
+        "images",
+        priority=priority,
+        keywords=keywords,
+        region="kr-kr",
+        safesearch="moderate",
+        size=size,
+        max_results=max_results,
+    )
 
-        return None, "대표 이미지를 찾지 못했어요."
-    except Exception:
-        wiki_image = _get_wikipedia_image(query)
-        if wiki_image:
-            return wiki_image, None
-        return None, "Unsplash 또는 보조 이미지 서비스 접근이 제한되어 이미지를 불러오지 못했어요."
+    image_urls = []
+    for item in results:
+        image_url = item.get("image") or item.get("thumbnail") or item.get("url")
+        if image_url:
+            image_urls.append(image_url)
+    return image_urls
 
 
 @st.cache_data(show_spinner=False, ttl=60 * 60 * 12)
-def get_landmark_images(query: str, limit: int = 3):
-    """대표 랜드마크 이미지를 최대 limit개 반환합니다."""
-    images = []
+@single_flight("landmark_candidates", key=lambda query: normalize_destination_key(query))
+@persistent_cache("landmark_candidates", ttl=60 * 60 * 12, is_negative=lambda result: not result["candidates"])
+def resolve_landmark_candidates(query: str):
+    """Unsplash + DuckDuckGo + Wikipedia 순으로 랜드마크 이미지 후보를 한 번씩만 조회해 순위대로 반환합니다.
 
-    primary_image, _ = get_landmark_image(query)
-    if primary_image:
-        images.append(primary_image)
+    Unsplash와 DuckDuckGo는 동시에 조회하고, DuckDuckGo가 IMAGE_HEDGE_DELAY 안에 끝나지 않으면
+    Wikipedia 보조 조회도 미리 시작해 가장 느린 출처를 기다리는 시간을 줄입니다.
+    """
+    executor = _get_fanout_executor()
+    unsplash_future = executor.submit(_get_unsplash_image, f"{query} landmark")
+    search_future = executor.submit(_search_ddgs_images, f"{query} landmark", "Large", LANDMARK_CANDIDATE_LIMIT)
 
-    try:
-        with DDGS() as ddgs:
-            results = list(
-                ddgs.images(
-                    keywords=f"{query} landmark",
-                    region="kr-kr",
-                    safesearch="moderate",
-                    size="Large",
-                    max_results=max(limit * 2, 4),
-                )
-            )
+    wiki_future = None
+    if not wait([search_future], timeout=IMAGE_HEDGE_DELAY).done:
+        wiki_future = executor.submit(_get_wikipedia_image, query)
 
-        for item in results:
-            image_url = item.get("image") or item.get("thumbnail") or item.get("url")
-            if image_url and image_url not in images:
-                images.append(image_url)
-            if len(images) >= limit:
-                break
+    search_failed = False
+    try:
+        search_hits = search_future.result()
     except Exception:
-        pass
+        search_hits = []
+        search_failed = True
+
+    if search_hits:
+        if wiki_future is not None:
+            wiki_future.cancel()
+        wiki_image = None
+    else:
+        wiki_future = wiki_future or executor.submit(_get_wikipedia_image, query)
+        wiki_image = wiki_future.result()
+
+    candidates = []
+    for url in [unsplash_future.result(), *search_hits, wiki_image]:
+        url = (url or "").strip()
+        if url and url not in candidates:
+            candidates.append(url)
+
+    error = None
+    if not candidates:
+        error = (
+            "Unsplash 또는 보조 이미지 서비스 접근이 제한되어 이미지를 불러오지 못했어요."
+            if search_failed
+            else "대표 이미지를 찾지 못했어요."
+        )
+
+    return {"candidates": candidates[:LANDMARK_CANDIDATE_LIMIT], "error": error}
 
-    return images[:limit]
+
+def get_landmark_image(query: str):
+    """랜드마크 이미지 후보 중 1순위 이미지와 오류 메시지를 반환합니다."""
+    resolved = resolve_landmark_candidates(query)
+    if resolved["candidates"]:
+        return resolved["candidates"][0], None
+    return None, resolved["error"]
+
+
+def get_landmark_images(query: str, limit: int = 3):
+    """대표 랜드마크 이미지를 최대 limit개 반환합니다."""
+    return resolve_landmark_candidates(query)["candidates"][:limit]
 
 
 @st.cache_data(show_spinner=False, ttl=60 * 60 * 12)
+@single_flight("representative_food", key=lambda query: normalize_destination_key(query))
+@persistent_cache("representative_food", ttl=60 * 60 * 12, is_negative=lambda result: result[1] is None)
 def get_representative_food(query: str):
     """도시/국가 기준 대표 먹거리 이름과 이미지를 반환합니다."""
     keywords = _extract_destination_keywords(query)
@@ -943,35 +1427,29 @@ def get_representative_food(query: str):
 
     image_query = food_name if food_name != "현지 대표 요리" else f"{keywords[0]} 대표 음식"
 
-    unsplash_image = _get_unsplash_image(image_query)
-    if unsplash_image:
-        return food_name, unsplash_image, None
-
-    try:
-        with DDGS() as ddgs:
-            results = list(
-                ddgs.images(
-                    keywords=image_query,
-                    region="kr-kr",
-                    safesearch="moderate",
-                    size="Medium",
-                    max_results=1,
-                )
-            )
-
-        if results and results[0].get("image"):
-            return food_name, results[0]["image"], None
-    except Exception:
-        pass
-
-    food_image = _get_wikipedia_image(food_name)
+    _, food_image = first_accepted_by_priority(
+        [
+            ("unsplash", functools.partial(_get_unsplash_image, image_query)),
+            ("ddgs", lambda: next(iter(_search_ddgs_images(image_query, "Medium", 1, DDGS_PRIORITY_LAZY)), None)),
+            ("wikipedia", functools.partial(_get_wikipedia_image, food_name)),
+        ],
+        hedge_delay=IMAGE_HEDGE_DELAY,
+    )
     if food_image:
         return food_name, food_image, None
 
     return food_name, None, "대표 먹거리 이미지를 찾지 못했어요."
 
 
-@st.cache_data(ttl=3600)
+@st.cache_data(show_spinner=False, ttl=3600)
+@single_flight(
+    "local_food",
+    key=lambda destination_name, limit=3: (
+        normalize_country_key(extract_country_from_destination(destination_name)),
+        limit,
+    ),
+)
+@persistent_cache("local_food", ttl=3600, is_negative=lambda meals: not meals)
 def get_local_food_recommendations(destination_name: str, limit: int = 3):
     """TheMealDB로 목적지 국가의 추천 로컬 푸드(레시피/이미지)를 반환합니다."""
     country = extract_country_from_destination(destination_name)
@@ -981,10 +1459,10 @@ def get_local_food_recommendations(destination_name: str, limit: int = 3):
         return []
 
     try:
-        area_response = requests.get(
+        area_response = upstream_get(
+            "themealdb",
             "https://www.themealdb.com/api/json/v1/1/filter.php",
             params={"a": meal_area},
-            timeout=8,
         )
         area_response.raise_for_status()
         meals = (area_response.json() or {}).get("meals") or []
@@ -999,10 +1477,10 @@ def get_local_food_recommendations(destination_name: str, limit: int = 3):
             source_url = ""
 
             if meal_id:
-                detail_response = requests.get(
+                detail_response = upstream_get(
+                    "themealdb",
                     "https://www.themealdb.com/api/json/v1/1/lookup.php",
                     params={"i": meal_id},
-                    timeout=8,
                 )
                 detail_response.raise_for_status()
                 detail = ((detail_response.json() or {}).get("meals") or [{}])[0]
@@ -1109,28 +1587,134 @@ def format_itinerary_with_dates(itinerary_items, travel_dates):
     return formatted
 
 
-def get_seasonal_travel_note(destination_name: str, latitude: float, travel_dates):
-    """여행 기간 평균 기후와 우기/태풍 시즌 경고를 반환합니다."""
+# 12개월 기후 행렬에서 함께 비교할 체류 기간(개월) 후보입니다. 실제 여행 기간 길이는 항상 추가됩니다.
+CLIMATE_WINDOW_MONTHS = (1, 2, 3)
+CLIMATE_COMFORT_TEMP = 22.0
+
+
+class ClimateEngine:
+    """기후대별 월 통계를 NumPy 배열로 들고, 여행지 × 출발 월 × 체류 기간 점수를 한 번에 계산합니다."""
+
+    def __init__(self, zone_stats):
+        import numpy as np
+
+        self._np = np
+        self.zones = tuple(zone_stats)
+        self._zone_index = {zone: idx for idx, zone in enumerate(self.zones)}
+        months = np.arange(1, 13)
+        self.temp = np.array([zone_stats[zone]["temp"] for zone in self.zones], dtype=float)
+        self.rain = np.array([zone_stats[zone]["rain"] for zone in self.zones], dtype=float)
+        self.rainy = np.array([np.isin(months, zone_stats[zone]["rainy_season"]) for zone in self.zones])
+        self.typhoon = np.array([np.isin(months, zone_stats[zone]["typhoon_season"]) for zone in self.zones])
+        self.notes = tuple(zone_stats[zone]["notes"] for zone in self.zones)
+
+    def zone_index(self, zone: str) -> int:
+        return self._zone_index[zone]
+
+    def score(self, zone_indexes, window_lengths):
+        """[여행지, 출발 월-1, 체류 기간] 모양의 배열 묶음을 반환합니다.
+
+        체류 기간은 출발 월부터 연속된 window_lengths[w]개월이며, 12월을 넘으면 1월로 이어집니다.
+        """
+        np = self._np
+        zone_indexes = np.asarray(zone_indexes, dtype=int)
+        lengths = np.asarray(window_lengths, dtype=int)
+        offsets = np.arange(lengths.max())
+        month_index = (np.arange(12)[:, None] + offsets[None, :]) % 12
+        within = (offsets[None, :] < lengths[:, None]).astype(float)
+
+        def window_mean(table):
+            return (table[zone_indexes][:, month_index] @ within.T) / lengths
+
+        avg_temp = window_mean(self.temp)
+        avg_rain = window_mean(self.rain)
+        rainy_share = window_mean(self.rainy.astype(float))
+        typhoon_share = window_mean(self.typhoon.astype(float))
+        temp_score = np.clip(1 - np.abs(avg_temp - CLIMATE_COMFORT_TEMP) / 15, 0, 1)
+        rain_score = np.clip(1 - avg_rain / 250, 0, 1)
+        total = 100 * (0.4 * temp_score + 0.3 * rain_score + 0.15 * (1 - rainy_share) + 0.15 * (1 - typhoon_share))
+        return {
+            "avg_temp": avg_temp,
+            "avg_rain": avg_rain,
+            "rainy_share": rainy_share,
+            "typhoon_share": typhoon_share,
+            "temp_score": temp_score,
+            "rain_score": rain_score,
+            "total": total,
+        }
+
+
+@st.cache_resource(show_spinner=False)
+def _get_climate_engine():
+    """프로세스 공용 기후 행렬 계산기를 반환합니다."""
+    return ClimateEngine(ZONE_CLIMATE_STATS)
+
+
+def resolve_climate_zone(destination_name: str, latitude: float) -> str:
     country = extract_country_from_destination(destination_name)
     zone = COUNTRY_CLIMATE_ZONE.get(country)
-
     if not zone:
         zone = "온대대륙" if abs(latitude) >= 20 else "열대몬순"
+    return zone
+
 
-    climate = ZONE_CLIMATE_STATS[zone]
+def build_climate_outlooks(destinations, travel_dates):
+    """모든 여행지의 12개월 × 체류 기간 기후 점수를 한 번에 계산해 여행지별 요약으로 나눕니다.
+
+    다른 출발 월·기간과의 비교는 이 결과 안에서 바로 꺼내 쓰므로 추가 조회가 필요 없습니다.
+    """
+    if not destinations:
+        return []
+
+    engine = _get_climate_engine()
     months = _get_trip_months(travel_dates)
-    month_indexes = [month - 1 for month in months]
+    window_lengths = tuple(sorted(set(CLIMATE_WINDOW_MONTHS) | {len(months)}))
+    trip_window = window_lengths.index(len(months))
+    zone_indexes = [
+        engine.zone_index(resolve_climate_zone(dest['name_kr'], dest['latitude'])) for dest in destinations
+    ]
+    scores = engine.score(zone_indexes, window_lengths)
+    trip_month_index = [month - 1 for month in months]
+    rainy_hits = engine.rainy[zone_indexes][:, trip_month_index]
+    typhoon_hits = engine.typhoon[zone_indexes][:, trip_month_index]
+
+    outlooks = []
+    for row, zone_idx in enumerate(zone_indexes):
+        outlooks.append(
+            MappingProxyType(
+                {
+                    "zone": engine.zones[zone_idx],
+                    "notes": engine.notes[zone_idx],
+                    "months": tuple(months),
+                    "window_lengths": window_lengths,
+                    "trip_window": trip_window,
+                    "avg_temp": float(scores["avg_temp"][row, months[0] - 1, trip_window]),
+                    "avg_rain": float(scores["avg_rain"][row, months[0] - 1, trip_window]),
+                    "rainy_months": tuple(m for m, hit in zip(months, rainy_hits[row]) if hit),
+                    "typhoon_months": tuple(m for m, hit in zip(months, typhoon_hits[row]) if hit),
+                    "monthly_temp": tuple(engine.temp[zone_idx].tolist()),
+                    "monthly_rain": tuple(engine.rain[zone_idx].tolist()),
+                    "window_totals": tuple(
+                        tuple(scores["total"][row, :, w].round(0).astype(int).tolist())
+                        for w in range(len(window_lengths))
+                    ),
+                }
+            )
+        )
+    return outlooks
 
-    avg_temp = sum(climate["temp"][idx] for idx in month_indexes) / len(month_indexes)
-    avg_rain = sum(climate["rain"][idx] for idx in month_indexes) / len(month_indexes)
 
-    rainy_overlap = [m for m in months if m in climate["rainy_season"]]
-    typhoon_overlap = [m for m in months if m in climate["typhoon_season"]]
+def get_seasonal_travel_note(outlook):
+    """여행 기간 평균 기후와 우기/태풍 시즌 경고를 반환합니다."""
+    avg_temp = outlook["avg_temp"]
+    avg_rain = outlook["avg_rain"]
+    rainy_overlap = outlook["rainy_months"]
+    typhoon_overlap = outlook["typhoon_months"]
 
     cautions = []
     if rainy_overlap:
         cautions.append(
-            f"⚠️ {', '.join(map(str, rainy_overlap))}월은 우기/강수 집중 구간입니다. {climate['notes']}"
+            f"⚠️ {', '.join(map(str, rainy_overlap))}월은 우기/강수 집중 구간입니다. {outlook['notes']}"
         )
     if typhoon_overlap:
         cautions.append(
@@ -1157,6 +1741,58 @@ def get_seasonal_travel_note(destination_name: str, latitude: float, travel_date
     )
 
 
+def _climate_cell_color(score: float) -> str:
+    """0~1 점수를 빨강(나쁨)~초록(좋음) 배경색으로 바꿉니다."""
+    return f"hsl({round(max(0.0, min(1.0, score)) * 120)}, 65%, 82%)"
+
+
+def build_climate_heatmap(outlook):
+    """여행지 1곳의 12개월 기후 히트맵 HTML과 현재 기간 길이 기준 추천 출발 월 안내를 만듭니다."""
+    start_month = outlook["months"][0]
+    header_cells = "".join(
+        f"<th style='padding:2px 4px;{'outline:2px solid #333;' if month == start_month else ''}'>{month}월</th>"
+        for month in range(1, 13)
+    )
+    rows = [
+        (
+            "기온(°C)",
+            [
+                (f"{temp:.0f}", 1 - abs(temp - CLIMATE_COMFORT_TEMP) / 15)
+                for temp in outlook["monthly_temp"]
+            ],
+        ),
+        ("강수(mm)", [(f"{rain:.0f}", 1 - rain / 250) for rain in outlook["monthly_rain"]]),
+    ]
+    for length, totals in zip(outlook["window_lengths"], outlook["window_totals"]):
+        rows.append((f"{length}개월 체류 점수", [(str(total), total / 100) for total in totals]))
+
+    body = "".join(
+        f"<tr><th style='text-align:left;padding:2px 6px;white-space:nowrap;'>{label}</th>"
+        + "".join(
+            f"<td style='text-align:center;padding:2px 4px;background:{_climate_cell_color(score)};'>{text}</td>"
+            for text, score in cells
+        )
+        + "</tr>"
+        for label, cells in rows
+    )
+    table = (
+        "<div style='overflow-x:auto;'><table style='border-collapse:collapse;font-size:0.8rem;width:100%;'>"
+        f"<thead><tr><th></th>{header_cells}</tr></thead><tbody>{body}</tbody></table></div>"
+    )
+
+    trip_totals = outlook["window_totals"][outlook["trip_window"]]
+    best_month = max(range(12), key=lambda idx: trip_totals[idx]) + 1
+    trip_length = outlook["window_lengths"][outlook["trip_window"]]
+    if best_month == start_month:
+        caption = f"지금 고른 {start_month}월 출발이 {trip_length}개월 체류 기준으로 가장 좋은 시기입니다."
+    else:
+        caption = (
+            f"{trip_length}개월 체류 기준 가장 좋은 출발 시기는 **{best_month}월**"
+            f"(점수 {trip_totals[best_month - 1]})이며, 지금 고른 {start_month}월은 {trip_totals[start_month - 1]}점입니다."
+        )
+    return table, caption
+
+
 def _resolve_travel_date_range(travel_dates):
     """여행 날짜 입력값을 시작일/종료일로 정규화합니다."""
     today = datetime.now().date()
@@ -1211,6 +1847,22 @@ def _extract_city_country(destination_name: str):
     return city_name, country_name
 
 
+def normalize_country_key(country_name: str):
+    """국가명을 캐시 키로 쓰기 위해 영문 소문자 표기로 정규화합니다."""
+    country_name = " ".join((country_name or "").split())
+    if country_name in {"한국", "South Korea", "Korea", "Republic of Korea"}:
+        country_name = "대한민국"
+    return COUNTRY_NAME_ALIASES.get(country_name, country_name).lower()
+
+
+def normalize_destination_key(destination_name: str):
+    """'도시명 (국가명)' 문자열을 캐시 키로 쓰기 위해 'city|country' 형태로 정규화합니다."""
+    city_name, country_name = _extract_city_country(destination_name)
+    city_name = " ".join(city_name.split())
+    city_key = CITY_NAME_ALIASES.get(city_name, city_name).lower()
+    return f"{city_key}|{normalize_country_key(country_name)}"
+
+
 def _build_teleport_queries(destination_name: str):
     city_name, country_name = _extract_city_country(destination_name)
     city_alias = CITY_NAME_ALIASES.get(city_name, city_name)
@@ -1303,8 +1955,116 @@ def _build_teleport_pros_cons(city_name: str, category_scores: dict, quality_sco
     return pros, cons
 
 
-@st.cache_data(show_spinner=False, ttl=60 * 60 * 12)
+def _build_teleport_insight(city_name: str, scores_data, image_url, source):
+    """Teleport 점수 응답을 화면에서 쓰는 도시 인사이트 묶음으로 변환합니다."""
+    categories = {
+        item.get("name"): round(item.get("score_out_of_10", 0), 1)
+        for item in scores_data.get("categories", [])
+        if item.get("name")
+    }
+
+    summary = _strip_html_tags(scores_data.get("summary", "요약 정보가 없습니다."))
+    quality_score = scores_data.get("teleport_city_score")
+    pros, cons = _build_teleport_pros_cons(city_name, categories, quality_score)
+
+    category_rank = sorted(
+        [(name, score) for name, score in categories.items() if isinstance(score, (int, float))],
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    top_categories = category_rank[:3]
+    bottom_categories = sorted(category_rank, key=lambda item: item[1])[:2]
+
+    return {
+        "city_name": city_name,
+        "summary": summary,
+        "quality_score": quality_score,
+        "categories": categories,
+        "top_categories": top_categories,
+        "bottom_categories": bottom_categories,
+        "image_url": image_url,
+        "teleport_url": scores_data.get("teleport_city_url"),
+        "source": source,
+        "pros": pros,
+        "cons": cons,
+    }
+
+
+TELEPORT_SNAPSHOT_PATH = os.environ.get(
+    "NOREGRET_TELEPORT_SNAPSHOT", os.path.join(APP_DIR, "data", "teleport_snapshot.json")
+)
+
+
+def _normalize_teleport_alias(alias: str):
+    return " ".join((alias or "").replace("-", " ").lower().split())
+
+
+@st.cache_resource(show_spinner=False)
+def _load_teleport_snapshot():
+    """번들된 Teleport 스냅샷과 도시 별칭 색인을 프로세스당 한 번만 만들어 반환합니다.
+
+    스냅샷은 scripts/build_teleport_snapshot.py로 생성하며, 도시 인사이트를 미리 계산해 두므로
+    조회 시에는 메모리 색인만 확인합니다.
+    """
+    try:
+        with open(TELEPORT_SNAPSHOT_PATH, encoding="utf-8") as snapshot_file:
+            raw_snapshot = json.load(snapshot_file)
+    except (OSError, ValueError):
+        return {"version": None, "insights": {}, "alias_index": {}}
+
+    insights = {}
+    alias_index = {}
+    for slug, area in raw_snapshot.get("urban_areas", {}).items():
+        insights[slug] = _build_teleport_insight(area["name"], area["scores"], area.get("image_url"), area.get("source"))
+        aliases = [slug, area["name"], *area.get("aliases", [])]
+        aliases += [f"{area['name']}, {country}" for country in area.get("countries", [])]
+        for alias in aliases:
+            alias_index.setdefault(_normalize_teleport_alias(alias), slug)
+
+    # 한국어 도시명/국가명 별칭도 같은 urban area로 연결합니다.
+    for korean_city, english_city in CITY_NAME_ALIASES.items():
+        slug = alias_index.get(_normalize_teleport_alias(english_city))
+        if slug:
+            alias_index.setdefault(_normalize_teleport_alias(korean_city), slug)
+            for korean_country, english_country in COUNTRY_NAME_ALIASES.items():
+                if alias_index.get(_normalize_teleport_alias(f"{english_city}, {english_country}")) == slug:
+                    alias_index.setdefault(_normalize_teleport_alias(f"{korean_city}, {english_country}"), slug)
+                    alias_index.setdefault(_normalize_teleport_alias(f"{korean_city}, {korean_country}"), slug)
+
+    return {"version": raw_snapshot.get("version"), "insights": insights, "alias_index": alias_index}
+
+
+def _lookup_teleport_snapshot(destination_name: str):
+    """스냅샷 색인에서 여행지에 해당하는 도시 인사이트를 찾습니다. 없으면 None을 반환합니다."""
+    snapshot = _load_teleport_snapshot()
+    if not snapshot["insights"]:
+        return None
+
+    _, search_queries = _build_teleport_queries(destination_name)
+    for query in search_queries:
+        slug = snapshot["alias_index"].get(_normalize_teleport_alias(query))
+        if slug:
+            return snapshot["insights"][slug]
+
+    return None
+
+
 def get_teleport_city_insights(destination_name: str):
+    """Teleport 도시 생활 인사이트(생활비/안전/삶의 질/요약/사진)를 반환합니다.
+
+    번들 스냅샷에 있는 도시는 메모리에서 바로 반환하고, 없는 도시만 Teleport API를 조회합니다.
+    """
+    snapshot_insight = _lookup_teleport_snapshot(destination_name)
+    if snapshot_insight:
+        return snapshot_insight
+
+    return _fetch_teleport_city_insights(destination_name)
+
+
+@st.cache_data(show_spinner=False, ttl=60 * 60 * 12)
+@single_flight("teleport_city_insights", key=lambda destination_name: normalize_destination_key(destination_name))
+@persistent_cache("teleport_city_insights", ttl=60 * 60 * 12)
+def _fetch_teleport_city_insights(destination_name: str):
     """Teleport API로 도시 생활 인사이트(생활비/안전/삶의 질/요약/사진)를 가져옵니다."""
     original_city_name, search_queries = _build_teleport_queries(destination_name)
     search_url = "https://api.teleport.org/api/cities/"
@@ -1314,7 +2074,7 @@ def get_teleport_city_insights(destination_name: str):
         resolved_city_name = original_city_name
 
         for query in search_queries:
-            search_res = requests.get(search_url, params={"search": query, "limit": 5}, timeout=12)
+            search_res = upstream_get("teleport", search_url, params={"search": query, "limit": 5})
             search_res.raise_for_status()
             search_data = search_res.json()
             city_results = search_data.get("_embedded", {}).get("city:search-results", [])
@@ -1324,7 +2084,7 @@ def get_teleport_city_insights(destination_name: str):
                 if not city_href:
                     continue
 
-                city_detail_res = requests.get(city_href, timeout=12)
+                city_detail_res = upstream_get("teleport", city_href)
                 city_detail_res.raise_for_status()
                 city_detail = city_detail_res.json()
                 candidate_urban_area = city_detail.get("_links", {}).get("city:urban_area", {}).get("href")
@@ -1340,52 +2100,24 @@ def get_teleport_city_insights(destination_name: str):
         if not urban_area_href:
             return None
 
-        scores_res = requests.get(f"{urban_area_href}scores/", timeout=12)
+        scores_res = upstream_get("teleport", f"{urban_area_href}scores/")
         scores_res.raise_for_status()
         scores_data = scores_res.json()
 
-        images_res = requests.get(f"{urban_area_href}images/", timeout=12)
+        images_res = upstream_get("teleport", f"{urban_area_href}images/")
         images_res.raise_for_status()
         images_data = images_res.json()
 
-        categories = {
-            item.get("name"): round(item.get("score_out_of_10", 0), 1)
-            for item in scores_data.get("categories", [])
-            if item.get("name")
-        }
-
-        summary = _strip_html_tags(scores_data.get("summary", "요약 정보가 없습니다."))
         image_url = images_data.get("photos", [{}])[0].get("image", {}).get("web")
 
-        quality_score = scores_data.get("teleport_city_score")
-        pros, cons = _build_teleport_pros_cons(resolved_city_name, categories, quality_score)
-
-        category_rank = sorted(
-            [(name, score) for name, score in categories.items() if isinstance(score, (int, float))],
-            key=lambda item: item[1],
-            reverse=True,
-        )
-        top_categories = category_rank[:3]
-        bottom_categories = sorted(category_rank, key=lambda item: item[1])[:2]
-
-        return {
-            "city_name": resolved_city_name,
-            "summary": summary,
-            "quality_score": quality_score,
-            "categories": categories,
-            "top_categories": top_categories,
-            "bottom_categories": bottom_categories,
-            "image_url": image_url,
-            "teleport_url": scores_data.get("teleport_city_url"),
-            "source": urban_area_href,
-            "pros": pros,
-            "cons": cons,
-        }
+        return _build_teleport_insight(resolved_city_name, scores_data, image_url, urban_area_href)
     except Exception:
         return None
 
 
 @st.cache_data(show_spinner=False, ttl=60 * 10)
+@single_flight("weather_summary")
+@persistent_cache("weather_summary", ttl=60 * 10, is_negative=lambda summary: "현재 날씨는" not in summary)
 def get_weather_summary(latitude: float, longitude: float, weather_api_key: str):
     """OpenWeather API로 현재 날씨 + 단기 예보를 요약합니다."""
     if not weather_api_key:
@@ -1402,11 +2134,11 @@ def get_weather_summary(latitude: float, longitude: float, weather_api_key: str)
     }
 
     try:
-        current_res = requests.get(current_endpoint, params=base_params, timeout=12)
+        current_res = upstream_get("openweather", current_endpoint, params=base_params)
         current_res.raise_for_status()
         current_data = current_res.json()
 
-        forecast_res = requests.get(forecast_endpoint, params=base_params, timeout=12)
+        forecast_res = upstream_get("openweather", forecast_endpoint, params=base_params)
         forecast_res.raise_for_status()
         forecast_data = forecast_res.json().get("list", [])
 
@@ -1435,6 +2167,7 @@ def get_weather_summary(latitude: float, longitude: float, weather_api_key: str)
 
 
 @st.cache_data(show_spinner=False, ttl=60 * 60)
+@single_flight("regret_summary")
 def build_regret_summary(api_key: str, destination_name: str, reason_text: str, regret_risk_warnings, teleport_insight=None):
     """AI로 추천도 별점/한줄 요약을 생성하고, 실패 시 휴리스틱으로 보정합니다."""
     warning_count = len(regret_risk_warnings)
@@ -1461,7 +2194,7 @@ def build_regret_summary(api_key: str, destination_name: str, reason_text: str,
         return fallback_star_rating, fallback_one_liner
 
     try:
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client(api_key)
         response = client.chat.completions.create(
             model="gpt-4o-mini",
             temperature=0.3,
@@ -1589,20 +2322,25 @@ def build_primary_caution(regret_risk_warnings, seasonal_note: str):
 
 
 @st.cache_data(show_spinner=False, ttl=60 * 60 * 12)
+@single_flight("festival_summary", key=lambda query: normalize_destination_key(query))
+@persistent_cache(
+    "festival_summary",
+    ttl=60 * 60 * 12,
+    is_negative=lambda summary: summary.startswith("축제 정보를 가져오지 못했어요"),
+)
 def get_festival_summary(query: str):
     """DuckDuckGo 텍스트 검색으로 축제/이벤트 정보 요약을 반환합니다."""
     current_year = datetime.now().year
 
     try:
-        with DDGS() as ddgs:
-            items = list(
-                ddgs.text(
-                    keywords=f"{query} festival event {current_year}",
-                    region="kr-kr",
-                    safesearch="moderate",
-                    max_results=3,
-                )
-            )
+        items = ddgs_search(
+            "text",
+            priority=DDGS_PRIORITY_LAZY,
+            keywords=f"{query} festival event {current_year}",
+            region="kr-kr",
+            safesearch="moderate",
+            max_results=3,
+        )
 
         if not items:
             return "검색 결과 기준, 근시일 내 확인 가능한 대표 축제 정보를 찾지 못했어요."
@@ -1613,178 +2351,108 @@ def get_festival_summary(query: str):
             snippet = item.get("body", "일정 정보는 링크에서 확인해 주세요.")
             summaries.append(f"- **{title}**: {snippet}")
 
-        return "\n".join(summaries)
-    except Exception as exc:
-        return f"축제 정보를 가져오지 못했어요: {exc}"
+        return "\n".join(summaries)
+    except Exception as exc:
+        return f"축제 정보를 가져오지 못했어요: {exc}"
+
+
+BGM_CACHE_TTL = 60 * 60 * 6
+# 카탈로그에서 검증되지 않은 후보는 우선순위 순서로 이 개수만큼만 동시에 oEmbed로 확인합니다.
+BGM_PROBE_WINDOW = 2
+BGM_CATALOG_PATH = os.path.join(APP_DIR, "data", "bgm_catalog.json")
+DEFAULT_BGM = ("재생 가능한 BGM을 찾지 못해 기본 라이브를 대신 재생합니다", "https://www.youtube.com/watch?v=jfKfPfyJRdk")
+
+
+@st.cache_resource(show_spinner=False)
+def _load_bgm_catalog():
+    """사전 검증된 BGM 카탈로그를 프로세스당 한 번만 읽어 반환합니다.
+
+    카탈로그는 scripts/refresh_bgm_catalog.py로 오프라인에서 갱신하며,
+    available 값이 true/false인 링크는 재생 가능 여부를 다시 조회하지 않습니다.
+    """
+    with open(BGM_CATALOG_PATH, encoding="utf-8") as catalog_file:
+        raw_catalog = json.load(catalog_file)
+
+    def to_candidates(entries):
+        return [(entry["title"], entry["url"]) for entry in entries]
+
+    all_entries = [
+        *(entry for entries in raw_catalog["city"].values() for entry in entries),
+        *(entry for entries in raw_catalog["country"].values() for entry in entries),
+        *raw_catalog["fallback"],
+        raw_catalog["generic"],
+    ]
+
+    # 같은 링크가 여러 항목에 있으면 검증 결과(true/false)가 있는 항목을 우선합니다.
+    status = {}
+    for entry in all_entries:
+        if status.get(entry["url"]) is None:
+            status[entry["url"]] = entry.get("available")
+
+    return {
+        "city": {keyword: to_candidates(entries) for keyword, entries in raw_catalog["city"].items()},
+        "country": {keyword: to_candidates(entries) for keyword, entries in raw_catalog["country"].items()},
+        "fallback": to_candidates(raw_catalog["fallback"]),
+        "generic": (raw_catalog["generic"]["title_template"], raw_catalog["generic"]["url"]),
+        "status": status,
+    }
 
 
 def get_destination_bgm(name_kr: str):
     """여행지 분위기/지역성을 반영한 유튜브 BGM 플레이리스트를 반환합니다."""
-    city = extract_place_name(name_kr)
-    country = extract_country_from_destination(name_kr)
+    return _get_destination_bgm_cached(normalize_destination_key(name_kr), name_kr)
 
-    city_bgm_map = {
-        "파리": [
-            ("파리 재즈 카페 & 샹송 무드", "https://www.youtube.com/watch?v=cTLTG4FTNBQ"),
-            ("프렌치 카페 아코디언 무드", "https://www.youtube.com/watch?v=DX9xA7gQ8V8"),
-        ],
-        "도쿄": [
-            ("도쿄 시티팝 드라이브", "https://www.youtube.com/watch?v=3bNITQR4Uso"),
-            ("도쿄 나이트 시티 재즈", "https://www.youtube.com/watch?v=neV3EPgvZ3g"),
-        ],
-        "오사카": [
-            ("오사카 네온 스트리트 시티팝", "https://www.youtube.com/watch?v=3bNITQR4Uso"),
-            ("일본 야경 감성 로파이", "https://www.youtube.com/watch?v=5yx6BWlEVcY"),
-        ],
-        "교토": [
-            ("교토 전통 악기 힐링 무드", "https://www.youtube.com/watch?v=4zG7WcW2nQ4"),
-            ("일본 전통 선율 명상 무드", "https://www.youtube.com/watch?v=H6M0EulApMM"),
-        ],
-        "치앙마이": [
-            ("치앙마이 카페 감성 로파이", "https://www.youtube.com/watch?v=5qap5aO4i9A"),
-            ("트로피컬 카페 칠 무드", "https://www.youtube.com/watch?v=rUxyKA_-grg"),
-        ],
-        "방콕": [
-            ("방콕 루프탑 나이트 무드", "https://www.youtube.com/watch?v=JfVOs4VSpmA"),
-            ("태국 야시장 감성 비트", "https://www.youtube.com/watch?v=M5QY2_8704o"),
-        ],
-        "다낭": [
-            ("다낭 해변 선셋 칠 음악", "https://www.youtube.com/watch?v=DWcJFNfaw9c"),
-            ("비치 선셋 칠아웃 라운지", "https://www.youtube.com/watch?v=7NOSDKb0HlU"),
-        ],
-        "하노이": [
-            ("하노이 올드쿼터 베트남 감성", "https://www.youtube.com/watch?v=uaf4iR5Vw9s"),
-            ("베트남 카페 어쿠스틱 무드", "https://www.youtube.com/watch?v=qaK4C8f8QeY"),
-        ],
-        "뉴올리언스": [
-            ("뉴올리언스 스트리트 재즈", "https://www.youtube.com/watch?v=Dx5qFachd3A"),
-            ("스윙 재즈 클럽 라이브", "https://www.youtube.com/watch?v=HMnrl0tmd3k"),
-        ],
-        "리스본": [
-            ("리스본 파두(Fado) 감성", "https://www.youtube.com/watch?v=QhBwrn7fG9k"),
-            ("포르투갈 기타 나이트 무드", "https://www.youtube.com/watch?v=EJeM7Q2q5Hw"),
-        ],
-        "세비야": [
-            ("세비야 플라멩코 무드", "https://www.youtube.com/watch?v=t4H_Zoh7G5A"),
-            ("스페인 기타 & 플라멩코 라이브", "https://www.youtube.com/watch?v=6jS8k6JwB-A"),
-        ],
-        "이비사": [
-            ("이비사 비치 하우스 뮤직", "https://www.youtube.com/watch?v=1bJY4wF2J3A"),
-            ("비치 클럽 칠 하우스", "https://www.youtube.com/watch?v=Q6MemVxEquE"),
-        ],
-        "두바이": [
-            ("사막 드라이브 아라비안 라운지", "https://www.youtube.com/watch?v=4jP06Wk6M4Q"),
-            ("미들 이스트 라운지 무드", "https://www.youtube.com/watch?v=tTL3kGxbl9M"),
-        ],
-        "카이로": [
-            ("카이로 아라빅 오리엔탈 무드", "https://www.youtube.com/watch?v=_O6fQkS3SIA"),
-            ("오리엔탈 전통 퍼커션 무드", "https://www.youtube.com/watch?v=owtDZFilZ6A"),
-        ],
-        "울란바토르": [
-            ("몽골 초원 & 호미(Hoomei) 무드", "https://www.youtube.com/watch?v=9e9v4M9RjvY"),
-            ("몽골 전통 현악/목가적 무드", "https://www.youtube.com/watch?v=p_5yt5IX38I"),
-        ],
-    }
 
-    country_bgm_map = {
-        "일본": [
-            ("일본 여행 무드 시티팝/재즈", "https://www.youtube.com/watch?v=3bNITQR4Uso"),
-            ("일본 로파이/재즈 플레이리스트", "https://www.youtube.com/watch?v=neV3EPgvZ3g"),
-        ],
-        "중국": [
-            ("중국 전통 악기 + 현대 퓨전 무드", "https://www.youtube.com/watch?v=9U8kbM_BhWc"),
-            ("중국 고전 선율 힐링 플레이리스트", "https://www.youtube.com/watch?v=Mh0x8mH5vPM"),
-        ],
-        "대만": [
-            ("대만 야시장 감성 인디팝", "https://www.youtube.com/watch?v=qM4vYf6A5LQ"),
-            ("대만 카페 감성 로파이", "https://www.youtube.com/watch?v=5qap5aO4i9A"),
-        ],
-        "홍콩": [
-            ("홍콩 야경 시네마틱 무드", "https://www.youtube.com/watch?v=AD8G7f8J6Vg"),
-            ("네온 시티 신스웨이브 무드", "https://www.youtube.com/watch?v=MVPTGNGiI-4"),
-        ],
-        "베트남": [
-            ("베트남 로컬 감성 어쿠스틱", "https://www.youtube.com/watch?v=uaf4iR5Vw9s"),
-            ("동남아 트래블 칠 플레이리스트", "https://www.youtube.com/watch?v=DWcJFNfaw9c"),
-        ],
-        "태국": [
-            ("태국 트로피컬 칠 & 로컬 무드", "https://www.youtube.com/watch?v=JfVOs4VSpmA"),
-            ("트로피컬 하우스 여행 무드", "https://www.youtube.com/watch?v=7NOSDKb0HlU"),
-        ],
-        "싱가포르": [
-            ("싱가포르 마리나 베이 라운지", "https://www.youtube.com/watch?v=6zXDo4dL7SU"),
-            ("어반 라운지/칠아웃 플레이리스트", "https://www.youtube.com/watch?v=qGaOlfmX8rQ"),
-        ],
-        "미국": [
-            ("미국 로드트립 클래식 플레이리스트", "https://www.youtube.com/watch?v=gEPmA3USJdI"),
-            ("로드트립 인디/포크 무드", "https://www.youtube.com/watch?v=V1Pl8CzNzCw"),
-        ],
-        "영국": [
-            ("런던 브릿팝 & 인디 감성", "https://www.youtube.com/watch?v=VbfpW0pbvaU"),
-            ("UK 인디 감성 플레이리스트", "https://www.youtube.com/watch?v=lTRiuFIWV54"),
-        ],
-        "프랑스": [
-            ("프랑스 샹송 & 파리지앵 재즈", "https://www.youtube.com/watch?v=cTLTG4FTNBQ"),
-            ("프렌치 카페 무드 재즈", "https://www.youtube.com/watch?v=DX9xA7gQ8V8"),
-        ],
-        "스페인": [
-            ("스페인 플라멩코 & 기타 무드", "https://www.youtube.com/watch?v=t4H_Zoh7G5A"),
-            ("스페인 기타 칠 무드", "https://www.youtube.com/watch?v=6jS8k6JwB-A"),
-        ],
-        "포르투갈": [
-            ("포르투갈 파두(Fado) 감성", "https://www.youtube.com/watch?v=QhBwrn7fG9k"),
-            ("파두 기타 라이브 감성", "https://www.youtube.com/watch?v=EJeM7Q2q5Hw"),
-        ],
-        "튀르키예": [
-            ("이스탄불 보스포루스 오리엔탈 무드", "https://www.youtube.com/watch?v=T4k_qws0k4E"),
-            ("터키 전통 & 현대 퓨전 무드", "https://www.youtube.com/watch?v=9fM2v1Vh4hk"),
-        ],
-        "아랍에미리트": [
-            ("중동 라운지 & 아라비안 나이트", "https://www.youtube.com/watch?v=4jP06Wk6M4Q"),
-            ("아라비안 라운지 칠아웃", "https://www.youtube.com/watch?v=tTL3kGxbl9M"),
-        ],
-        "이집트": [
-            ("이집트 전통 리듬 & 오리엔탈 무드", "https://www.youtube.com/watch?v=_O6fQkS3SIA"),
-            ("오리엔탈 클래식 인스트루멘탈", "https://www.youtube.com/watch?v=owtDZFilZ6A"),
-        ],
-        "몽골": [
-            ("몽골 전통/초원 무드 사운드", "https://www.youtube.com/watch?v=9e9v4M9RjvY"),
-            ("몽골 민속 선율 플레이리스트", "https://www.youtube.com/watch?v=p_5yt5IX38I"),
-        ],
-    }
+@st.cache_data(show_spinner=False, ttl=NEGATIVE_CACHE_TTL)
+@single_flight("destination_bgm")
+@persistent_cache(
+    "destination_bgm",
+    ttl=BGM_CACHE_TTL,
+    negative_ttl=NEGATIVE_CACHE_TTL,
+    is_negative=lambda bgm: tuple(bgm) == DEFAULT_BGM,
+)
+def _get_destination_bgm_cached(destination_key: str, _name_kr: str):
+    """정규화한 도시/국가 키 기준으로 BGM 선택 결과를 캐시합니다."""
+    city = extract_place_name(_name_kr)
+    country = extract_country_from_destination(_name_kr)
 
-    fallback_candidates = [
-        ("잔잔한 여행 로파이 라이브", "https://www.youtube.com/watch?v=jfKfPfyJRdk"),
-        ("여행 브이로그용 감성 BGM 모음", "https://www.youtube.com/watch?v=DWcJFNfaw9c"),
-        ("트래블 칠아웃 플레이리스트", "https://www.youtube.com/watch?v=7NOSDKb0HlU"),
-        ("카페 로파이 집중 음악", "https://www.youtube.com/watch?v=5qap5aO4i9A"),
-    ]
+    catalog = _load_bgm_catalog()
+    fallback_candidates = catalog["fallback"]
 
-    for keyword, bgm_candidates in city_bgm_map.items():
+    for keyword, bgm_candidates in catalog["city"].items():
         if keyword in city:
             return pick_available_bgm([*bgm_candidates, *fallback_candidates], f"{city} travel bgm playlist")
 
-    for keyword, bgm_candidates in country_bgm_map.items():
+    for keyword, bgm_candidates in catalog["country"].items():
         if keyword in country:
             return pick_available_bgm([*bgm_candidates, *fallback_candidates], f"{country} travel bgm playlist")
 
+    generic_title_template, generic_url = catalog["generic"]
     return pick_available_bgm(
         [
-            (f"{country} 여행 분위기에 어울리는 로컬/무드 음악", "https://www.youtube.com/watch?v=2OEL4P1Rz04"),
+            (generic_title_template.format(country=country), generic_url),
             *fallback_candidates,
         ],
         f"{country} travel bgm playlist",
     )
 
 
-@st.cache_data(ttl=3600)
+def _is_bgm_playable(url: str, catalog_status):
+    if catalog_status.get(url) is True:
+        return True
+    return is_youtube_video_available(url)
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+@single_flight("youtube_available")
+@persistent_cache("youtube_available", ttl=3600, is_negative=lambda available: not available)
 def is_youtube_video_available(url: str):
     """YouTube oEmbed 응답으로 재생 가능한 영상인지 확인합니다."""
     try:
-        response = requests.get(
+        response = upstream_get(
+            "youtube",
             "https://www.youtube.com/oembed",
             params={"url": url, "format": "json"},
-            timeout=4,
         )
         return response.status_code == 200
     except Exception:
@@ -1793,30 +2461,67 @@ def is_youtube_video_available(url: str):
 
 def pick_available_bgm(candidates, search_query: str):
     """후보 링크 중 재생 가능한 BGM을 우선 선택하고, 없으면 검색 결과에서 대체합니다."""
-    for title, url in candidates:
-        if is_youtube_video_available(url):
-            return title, url
+    return _pick_available_bgm_cached(
+        tuple(tuple(candidate) for candidate in candidates),
+        " ".join(search_query.lower().split()),
+    )
+
+
+@st.cache_data(show_spinner=False, ttl=NEGATIVE_CACHE_TTL)
+@single_flight("available_bgm")
+@persistent_cache(
+    "available_bgm",
+    ttl=BGM_CACHE_TTL,
+    negative_ttl=NEGATIVE_CACHE_TTL,
+    is_negative=lambda bgm: tuple(bgm) == DEFAULT_BGM,
+)
+def _pick_available_bgm_cached(candidates, search_query: str):
+    """후보 목록과 정규화한 검색어 기준으로 BGM 선택 결과를 캐시합니다."""
+    catalog_status = _load_bgm_catalog()["status"]
+    playable_candidates = [candidate for candidate in candidates if catalog_status.get(candidate[1]) is not False]
+
+    # 카탈로그에서 이미 검증된 링크가 가장 앞선 후보라면 네트워크 조회 없이 바로 사용합니다.
+    if playable_candidates and catalog_status.get(playable_candidates[0][1]) is True:
+        return playable_candidates[0]
+
+    winner, _ = first_accepted_by_priority(
+        [
+            ((title, url), functools.partial(_is_bgm_playable, url, catalog_status))
+            for title, url in playable_candidates
+        ],
+        max_in_flight=BGM_PROBE_WINDOW,
+    )
+    if winner:
+        return winner
 
     try:
-        with DDGS() as ddgs:
-            items = list(
-                ddgs.text(
-                    keywords=f"site:youtube.com {search_query}",
-                    region="wt-wt",
-                    safesearch="moderate",
-                    max_results=8,
-                )
-            )
+        items = ddgs_search(
+            "text",
+            priority=DDGS_PRIORITY_LAZY,
+            keywords=f"site:youtube.com {search_query}",
+            region="wt-wt",
+            safesearch="moderate",
+            max_results=8,
+        )
 
-        for item in items:
-            title = item.get("title", "추천 BGM")
-            href = item.get("href", "")
-            if "youtube.com/watch" in href and is_youtube_video_available(href):
-                return f"{title} (자동 추천)", href
+        searched_candidates = [
+            (f"{item.get('title', '추천 BGM')} (자동 추천)", item.get("href", ""))
+            for item in items
+            if "youtube.com/watch" in item.get("href", "")
+        ]
+        winner, _ = first_accepted_by_priority(
+            [
+                ((title, href), functools.partial(is_youtube_video_available, href))
+                for title, href in searched_candidates
+            ],
+            max_in_flight=BGM_PROBE_WINDOW,
+        )
+        if winner:
+            return winner
     except Exception:
         pass
 
-    return "재생 가능한 BGM을 찾지 못해 기본 라이브를 대신 재생합니다", "https://www.youtube.com/watch?v=jfKfPfyJRdk"
+    return DEFAULT_BGM
 
 
 def extract_country_from_destination(name_kr: str):
@@ -1826,149 +2531,145 @@ def extract_country_from_destination(name_kr: str):
     return name_kr.strip()
 
 
-def get_regret_risk_warnings(style: str, destination_name: str, reason_text: str):
-    """여행 스타일 미스매치 + 목적지의 보편적 리스크를 후회 가능성 경고로 반환합니다."""
-    text = f"{destination_name} {reason_text}".lower()
-    city = destination_name.split("(")[0].strip()
-    destination_traits = {
-        "쇼핑/도시": ["쇼핑", "야경", "도시", "몰", "백화점", "city", "nightlife"],
-        "휴양/바다": ["휴양", "리조트", "해변", "바다", "비치", "beach"],
-        "관광/유적": ["관광", "유적", "박물관", "역사", "궁전", "성당", "heritage"],
-        "대자연/트레킹": ["대자연", "트레킹", "하이킹", "산", "국립공원", "빙하", "safari"],
-        "미식/로컬푸드": ["미식", "로컬푸드", "야시장", "맛집", "레스토랑", "gourmet"],
-    }
-    mismatch_messages = {
-        "휴양/바다 (물놀이)": {
-            "쇼핑/도시": "⚠️ 이 도시는 쇼핑/야경 중심이라 물놀이·휴양 비중이 기대보다 낮을 수 있어요.",
-            "관광/유적": "⚠️ 이 여행지는 역사·도보 관광 비중이 있어 완전 휴양형 여행과는 결이 다를 수 있어요.",
-        },
-        "관광/유적 (많이 걷기)": {
-            "쇼핑/도시": "⚠️ 이 도시는 쇼핑/야경 중심이라 관광지를 많이 보는 스타일과는 맞지 않을 수 있습니다.",
-            "휴양/바다": "⚠️ 휴양 중심 동선이면 유적·역사 탐방 밀도가 낮아 아쉬울 수 있어요.",
-        },
-        "쇼핑/도시": {
-            "대자연/트레킹": "⚠️ 이 목적지는 자연/트레킹 중심이라 쇼핑 인프라가 제한적일 수 있어요.",
-            "휴양/바다": "⚠️ 휴양지 특성상 대형 쇼핑 스폿이 적어 도시형 쇼핑 여행과 결이 다를 수 있어요.",
-        },
-        "대자연/트레킹": {
-            "쇼핑/도시": "⚠️ 도시/쇼핑 비중이 높아 대자연 체험 시간을 충분히 확보하기 어려울 수 있어요.",
-            "휴양/바다": "⚠️ 해변 휴양 중심 일정이면 트레킹 강도가 기대보다 약할 수 있어요.",
-        },
-        "미식/로컬푸드": {
-            "대자연/트레킹": "⚠️ 자연/트레킹 위주 여행지는 식도락 선택지가 제한될 수 있어요.",
-        },
-    }
+class KeywordAutomaton:
+    """여러 키워드를 한 번에 찾는 Aho-Corasick 자동자입니다.
 
-    generic_risk_rules = [
-        {
-            "keywords": ["스위스", "아이슬란드", "두바이", "런던", "뉴욕", "파리", "싱가포르"],
-            "message": "⚠️ 현지 물가가 높은 편이라 식비·교통비·입장료가 예상보다 커질 수 있어요.",
-        },
-        {
-            "keywords": ["런던", "파리", "암스테르담", "아이슬란드", "영국"],
-            "message": "⚠️ 비·강풍 등 변덕스러운 날씨로 실외 일정이 자주 바뀔 수 있어요.",
-        },
-        {
-            "keywords": ["로마", "바르셀로나", "파리", "방콕"],
-            "message": "⚠️ 관광객이 많은 지역은 소매치기·잡상인 이슈가 있어 동선별 주의가 필요해요.",
-        },
-    ]
+    키워드마다 붙인 값(규칙 ID 등)을 함께 저장해 두고, 텍스트를 한 번 훑으면서 찾은 키워드의 끝 위치와 값을 돌려줍니다.
+    """
 
-    distance_risk_rules = [
-        {
-            "keywords": ["미국", "캐나다", "영국", "프랑스", "독일", "스페인", "포르투갈", "이탈리아", "아이슬란드"],
-            "message": "⚠️ 장거리 노선은 비행시간이 길고 시차 적응이 필요해, 실제 관광 가능한 시간이 예상보다 줄 수 있어요.",
-        },
-        {
-            "keywords": ["이집트", "크로아티아", "포르투갈", "핀란드", "체코", "헝가리", "오스트리아", "노르웨이"],
-            "message": "⚠️ 출발일/도시 조합에 따라 직항이 없거나 좌석이 적어 경유 대기시간이 길어질 수 있어요.",
-        },
-    ]
+    def __init__(self, keyword_payloads):
+        self._goto = [{}]
+        self._fail = [0]
+        self._outputs = [[]]
+
+        for keyword, payload in keyword_payloads:
+            state = 0
+            for char in keyword.lower():
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append([])
+                state = next_state
+            self._outputs[state].append(payload)
+
+        queue_states = deque(self._goto[0].values())
+        while queue_states:
+            state = queue_states.popleft()
+            for char, next_state in self._goto[state].items():
+                queue_states.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+
+    def scan(self, text: str):
+        """(키워드 끝 위치, 값) 쌍을 텍스트 앞에서부터 순서대로 반환합니다."""
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for payload in self._outputs[state]:
+                yield index, payload
+
+
+@st.cache_resource(show_spinner=False)
+def _get_regret_rule_automaton():
+    """후회 가능성 경고 규칙의 키워드를 한 번만 자동자로 만들어 공유합니다."""
+    keyword_payloads = []
+    for trait, keywords in REGRET_DESTINATION_TRAITS.items():
+        keyword_payloads.extend((keyword, ("trait", trait)) for keyword in keywords)
+    for rule_id, rule in enumerate(REGRET_KEYWORD_RULES):
+        keyword_payloads.extend((keyword, ("rule", rule_id)) for keyword in rule["keywords"])
+    for keyword in REGRET_CITY_SPECIFIC_RISKS:
+        keyword_payloads.append((keyword, ("city", keyword)))
+    return KeywordAutomaton(keyword_payloads)
+
+
+def get_regret_risk_warnings_batch(style: str, destinations):
+    """(여행지명, 추천 이유) 목록을 받아 여행지마다 후회 가능성 경고 목록을 반환합니다.
+
+    모든 규칙의 키워드를 자동자 하나로 찾으므로 여행지마다 텍스트를 한 번만 훑습니다.
+    """
+    automaton = _get_regret_rule_automaton()
+    style_messages = REGRET_STYLE_MISMATCH_MESSAGES.get(style, {})
+    trait_order = list(REGRET_DESTINATION_TRAITS)
+    city_order = list(REGRET_CITY_SPECIFIC_RISKS)
+
+    results = []
+    for destination_name, reason_text in destinations:
+        text = f"{destination_name} {reason_text}".lower()
+        # 도시별 리스크는 여행지명의 도시 부분에서 찾은 키워드에만 적용합니다.
+        city_end = len(destination_name.split("(")[0].rstrip().lower())
+
+        traits, rule_ids, cities = set(), set(), set()
+        for end_index, (kind, value) in automaton.scan(text):
+            if kind == "trait":
+                traits.add(value)
+            elif kind == "rule":
+                rule_ids.add(value)
+            elif end_index < city_end:
+                cities.add(value)
+
+        candidates = [style_messages.get(trait) for trait in trait_order if trait in traits]
+        candidates += [REGRET_KEYWORD_RULES[rule_id]["message"] for rule_id in sorted(rule_ids)]
+        candidates += [REGRET_CITY_SPECIFIC_RISKS[city] for city in city_order if city in cities]
+
+        warnings = []
+        for message in candidates:
+            if message and message not in warnings:
+                warnings.append(message)
+
+        for message in REGRET_FALLBACK_MESSAGES:
+            if len(warnings) >= 2:
+                break
+            if message not in warnings:
+                warnings.append(message)
 
-    local_adaptation_rules = [
-        {
-            "keywords": ["인도", "이집트", "몽골", "라오스", "베트남", "태국"],
-            "message": "⚠️ 향신료·조리 방식·수질 차이로 음식이 낯설 수 있어 첫날은 무난한 메뉴로 적응하는 편이 안전해요.",
-        },
-        {
-            "keywords": ["두바이", "아랍에미리트", "카이로", "울란바토르"],
-            "message": "⚠️ 기온 편차(한낮 고온/야간 저온)나 건조한 공기로 컨디션이 흔들릴 수 있어 복장/보습 대비가 필요해요.",
-        },
-        {
-            "keywords": ["런던", "암스테르담", "아이슬란드", "뉴질랜드"],
-            "message": "⚠️ 날씨 변동 폭이 큰 지역이라 같은 날에도 비·바람이 반복될 수 있어 실내 대안 동선을 준비해 두세요.",
-        },
-    ]
+        results.append(warnings)
 
-    city_specific_risks = {
-        "뉴욕": "⚠️ 맨해튼 중심 숙소/교통비가 높아 보이는 예산보다 현지 지출이 빠르게 커질 수 있어요.",
-        "파리": "⚠️ 주요 관광지는 대기줄이 길어 사전 예약이 없으면 하루 동선이 크게 밀릴 수 있어요.",
-        "런던": "⚠️ 지하철 파업·공사 이슈가 간헐적으로 있어 이동 동선 플랜B를 준비하는 것이 좋아요.",
-        "방콕": "⚠️ 출퇴근 시간대 교통체증이 심해, 지도상 거리보다 이동시간이 2배 이상 걸릴 수 있어요.",
-        "도쿄": "⚠️ 러시아워 전철 혼잡도가 높아 캐리어 이동은 피크 시간을 피하는 편이 좋아요.",
-        "로마": "⚠️ 인기 유적지는 휴관일·예약 슬롯 변동이 잦아 일정 확정 전에 운영시간 재확인이 필요해요.",
-    }
+    return results
 
-    detected_traits = {
-        trait
-        for trait, keywords in destination_traits.items()
-        if any(keyword in text for keyword in keywords)
-    }
 
-    warnings = []
-    for trait in detected_traits:
-        warning = mismatch_messages.get(style, {}).get(trait)
-        if warning and warning not in warnings:
-            warnings.append(warning)
-
-    for rule in generic_risk_rules:
-        if any(keyword.lower() in text for keyword in rule["keywords"]):
-            if rule["message"] not in warnings:
-                warnings.append(rule["message"])
-
-    for rule in distance_risk_rules:
-        if any(keyword.lower() in text for keyword in rule["keywords"]):
-            if rule["message"] not in warnings:
-                warnings.append(rule["message"])
-
-    for rule in local_adaptation_rules:
-        if any(keyword.lower() in text for keyword in rule["keywords"]):
-            if rule["message"] not in warnings:
-                warnings.append(rule["message"])
-
-    for keyword, message in city_specific_risks.items():
-        if keyword in city and message not in warnings:
-            warnings.append(message)
-
-    fallback_messages = [
-        "⚠️ 성수기에는 항공권·숙소 가격이 급등해 같은 예산으로 체감 퀄리티가 낮아질 수 있어요.",
-        "⚠️ 관광지 오픈시간/휴무일이 수시로 바뀌므로 핵심 스팟은 공식 사이트에서 재확인하세요.",
-        "⚠️ 현지 교통 파업·행사·우천 변수로 당일 동선이 바뀔 수 있어 대체 코스를 미리 정해두는 게 좋아요.",
-    ]
+def get_regret_risk_warnings(style: str, destination_name: str, reason_text: str):
+    """여행 스타일 미스매치 + 목적지의 보편적 리스크를 후회 가능성 경고로 반환합니다."""
+    return get_regret_risk_warnings_batch(style, [(destination_name, reason_text)])[0]
 
-    for message in fallback_messages:
-        if len(warnings) >= 2:
-            break
-        if message not in warnings:
-            warnings.append(message)
 
-    return warnings
+SEARCH_SUMMARY_CACHE_TTL = 60 * 60 * 12
 
 
 def get_destination_issue_summary(destination_name: str):
     """검색 결과 스니펫을 바탕으로 여행지의 자주 언급되는 이슈를 요약합니다."""
+    return _get_destination_issue_summary_cached(normalize_destination_key(destination_name), destination_name)
+
+
+@st.cache_data(show_spinner=False, ttl=NEGATIVE_CACHE_TTL)
+@single_flight("destination_issue_summary")
+@persistent_cache(
+    "destination_issue_summary",
+    ttl=SEARCH_SUMMARY_CACHE_TTL,
+    negative_ttl=NEGATIVE_CACHE_TTL,
+    is_negative=lambda result: result[1] is None,
+)
+def _get_destination_issue_summary_cached(destination_key: str, _destination_name: str):
+    """정규화한 도시/국가 키 기준으로 문제점 검색 요약을 캐시합니다."""
+    destination_name = _destination_name
     search_query = f"{destination_name} 여행 단점 문제점 주의할 점"
 
     try:
-        with DDGS() as ddgs:
-            items = list(
-                ddgs.text(
-                    keywords=search_query,
-                    region="kr-kr",
-                    safesearch="moderate",
-                    max_results=4,
-                )
-            )
+        items = ddgs_search(
+            "text",
+            priority=DDGS_PRIORITY_LAZY,
+            keywords=search_query,
+            region="kr-kr",
+            safesearch="moderate",
+            max_results=4,
+        )
 
         if not items:
             return ["검색 기반 문제점을 찾지 못했어요. 최신 후기는 출발 전 다시 확인해 주세요."], None
@@ -1985,29 +2686,47 @@ def get_destination_issue_summary(destination_name: str):
         return [f"문제점 검색 요약을 가져오지 못했어요: {exc}"], None
 
 
+ENTRY_REQUIREMENT_SEARCH_FALLBACK = {
+    "visa": "검색 결과 기준 최신 정책 확인 필요",
+    "stay": "검색 결과에서 체류기간 확인 필요",
+    "eta": "검색 결과에서 ETA/ESTA 여부 확인 필요",
+    "passport": "대부분 국가에서 6개월 이상 유효기간 권장",
+}
+
+
+def _is_entry_requirement_fallback(requirement):
+    return all(requirement.get(field) == value for field, value in ENTRY_REQUIREMENT_SEARCH_FALLBACK.items())
+
+
 def _summarize_entry_requirement_from_search(country: str):
     """검색 결과 스니펫을 바탕으로 비자/입국 요건을 요약합니다."""
-    search_query = f"{country} 대한민국 여권 비자 체류 기간 ETA ESTA 여권 유효기간"
+    return _summarize_entry_requirement_cached(normalize_country_key(country), country)
+
+
+@st.cache_data(show_spinner=False, ttl=NEGATIVE_CACHE_TTL)
+@single_flight("entry_requirement_search")
+@persistent_cache(
+    "entry_requirement_search",
+    ttl=SEARCH_SUMMARY_CACHE_TTL,
+    negative_ttl=NEGATIVE_CACHE_TTL,
+    is_negative=_is_entry_requirement_fallback,
+)
+def _summarize_entry_requirement_cached(country_key: str, _country: str):
+    """정규화한 국가 키 기준으로 비자/입국 요건 검색 요약을 캐시합니다."""
+    search_query = f"{_country} 대한민국 여권 비자 체류 기간 ETA ESTA 여권 유효기간"
     search_results_url = f"https://duckduckgo.com/?q={quote_plus(search_query)}"
 
-    fallback = {
-        "visa": "검색 결과 기준 최신 정책 확인 필요",
-        "stay": "검색 결과에서 체류기간 확인 필요",
-        "eta": "검색 결과에서 ETA/ESTA 여부 확인 필요",
-        "passport": "대부분 국가에서 6개월 이상 유효기간 권장",
-        "source": search_results_url,
-    }
+    fallback = {**ENTRY_REQUIREMENT_SEARCH_FALLBACK, "source": search_results_url}
 
     try:
-        with DDGS() as ddgs:
-            items = list(
-                ddgs.text(
-                    keywords=search_query,
-                    region="kr-kr",
-                    safesearch="moderate",
-                    max_results=5,
-                )
-            )
+        items = ddgs_search(
+            "text",
+            priority=DDGS_PRIORITY_LAZY,
+            keywords=search_query,
+            region="kr-kr",
+            safesearch="moderate",
+            max_results=5,
+        )
 
         if not items:
             return fallback
@@ -2064,7 +2783,7 @@ def get_entry_requirement_for_korean_passport(destination_name: str):
     requirement = ENTRY_REQUIREMENTS_BY_COUNTRY.get(country)
 
     if requirement:
-        return country, requirement, False
+        return country, dict(requirement), False
 
     searched_requirement = _summarize_entry_requirement_from_search(country)
     return country, searched_requirement, True
@@ -2072,6 +2791,8 @@ def get_entry_requirement_for_korean_passport(destination_name: str):
 
 def render_kakao_share_copy_button(share_text: str):
     """카카오톡 공유용 텍스트를 클립보드에 복사하는 버튼을 렌더링합니다."""
+    import streamlit.components.v1 as components
+
     safe_text = json.dumps(share_text)
 
     components.html(
@@ -2209,21 +2930,502 @@ travel_dates = (departure_date, arrival_date)
 etc_req = st.text_input("특별 요청 (예: 사막이 보고 싶어요, 미술관 투어 원함)")
 
 
-def render_destination_results(destinations, duration_label, selected_travel_dates):
+ENRICHMENT_MAX_WORKERS = 32
+
+
+@st.cache_resource(show_spinner=False)
+def _get_enrichment_executor():
+    """여행지 부가 정보 조회에 쓰는 프로세스 공용 스레드 풀을 반환합니다."""
+    return ThreadPoolExecutor(max_workers=ENRICHMENT_MAX_WORKERS, thread_name_prefix="enrichment")
+
+
+def _build_regret_summary_after_teleport(api_key: str, dest, regret_risk_warnings, teleport_future):
+    """Teleport 조회가 끝나면 그 결과를 반영해 추천도 요약을 생성합니다."""
+    try:
+        teleport_insight = teleport_future.result()
+    except Exception:
+        teleport_insight = None
+
+    return build_regret_summary(
+        api_key,
+        dest['name_kr'],
+        dest['reason'],
+        regret_risk_warnings,
+        teleport_insight,
+    )
+
+
+RENDER_LATENCY_BUDGET_SECONDS = float(os.environ.get("NOREGRET_RENDER_BUDGET_SECONDS", "3"))
+PENDING_ENRICHMENT_POLL_SECONDS = 1.0
+
+
+def _collect_enrichment_result(future, fallback, deadline=None):
+    """조회 작업 결과를 꺼내고, 작업이 실패하거나 deadline까지 끝나지 않으면 대체값을 반환합니다."""
+    timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+    try:
+        return future.result(timeout=timeout)
+    except FuturesTimeoutError:
+        return fallback
+    except Exception:
+        return fallback
+
+
+def _get_landmark_display_images(name_kr: str):
+    """대표 랜드마크 이미지를 찾아 표시용 썸네일로 바꿉니다."""
+    return get_display_images(get_landmark_images(name_kr, 3), "landmark")
+
+
+def _get_local_food_display_items(name_kr: str):
+    """로컬 푸드 추천의 음식 사진을 표시용 썸네일로 바꿉니다."""
+    meals = [dict(meal) for meal in get_local_food_recommendations(name_kr)]
+    for meal, image in zip(meals, get_display_images([meal.get("image") for meal in meals], "meal")):
+        meal["image"] = image
+    return meals
+
+
+def start_destination_enrichment(dest, style: str, api_key: str, weather_api_key: str, reuse=None):
+    """여행지 1곳의 외부 조회를 스레드 풀에 예약하고, 진행 중인 작업 묶음을 반환합니다.
+
+    결과를 기다리지 않으므로 여러 여행지의 조회를 한꺼번에 예약할 수 있습니다.
+    접힌 상세 섹션에만 쓰이는 조회는 lazy에 담아 두었다가 사용자가 섹션을 열 때 실행하고,
+    그 작업은 화면 본문의 시간 예산과 섞이지 않도록 lazy_futures에 따로 보관합니다.
+    reuse에 넘긴 작업은 다시 예약하지 않고 그대로 이어받습니다.
+    """
+    executor = _get_enrichment_executor()
+    reuse = reuse or {}
+    name_kr = dest['name_kr']
+    regret_risk_warnings = get_regret_risk_warnings(style, name_kr, dest['reason'])
+
+    def submit(key, func, *args):
+        return reuse[key] if key in reuse else executor.submit(func, *args)
+
+    futures = {
+        "landmark_images": submit("landmark_images", _get_landmark_display_images, name_kr),
+        "teleport_insight": submit("teleport_insight", get_teleport_city_insights, name_kr),
+        "weather_summary": submit(
+            "weather_summary", get_weather_summary, dest['latitude'], dest['longitude'], weather_api_key
+        ),
+    }
+    # Teleport 작업이 먼저 큐에 들어가 있으므로, 이 작업이 Teleport 결과를 기다려도 풀이 막히지 않습니다.
+    futures["regret_summary"] = submit(
+        "regret_summary",
+        _build_regret_summary_after_teleport,
+        api_key,
+        dest,
+        regret_risk_warnings,
+        futures["teleport_insight"],
+    )
+
+    fallbacks = {
+        "landmark_images": [],
+        "teleport_insight": None,
+        "weather_summary": "날씨 정보를 가져오지 못했어요.",
+        "festival_summary": "축제 정보를 가져오지 못했어요.",
+        "entry_requirement": (
+            extract_country_from_destination(name_kr),
+            {
+                "visa": "최신 정책 확인 필요",
+                "stay": "체류기간 확인 필요",
+                "eta": "ETA/ESTA 여부 확인 필요",
+                "passport": "대부분 국가에서 6개월 이상 유효기간 권장",
+            },
+            True,
+        ),
+        "bgm": DEFAULT_BGM,
+        "local_foods": [],
+        "regret_summary": build_regret_summary("", name_kr, dest['reason'], regret_risk_warnings),
+    }
+
+    lazy = {
+        "festival_summary": functools.partial(get_festival_summary, name_kr),
+        "entry_requirement": functools.partial(get_entry_requirement_for_korean_passport, name_kr),
+        "bgm": functools.partial(get_destination_bgm, name_kr),
+        "local_foods": functools.partial(_get_local_food_display_items, name_kr),
+    }
+    lazy_futures = {key: future for key, future in reuse.items() if key in lazy}
+
+    return {
+        "futures": futures,
+        "lazy": lazy,
+        "lazy_futures": lazy_futures,
+        "fallbacks": fallbacks,
+        "regret_risk_warnings": regret_risk_warnings,
+    }
+
+
+def collect_destination_enrichment(pending_enrichment, deadline=None):
+    """예약된 조회 작업을 deadline까지 기다려 여행지 1곳의 결과 묶음을 만듭니다.
+
+    제때 끝나지 않은 작업은 대체값으로 채우고, 작업 자체는 계속 진행되도록 그대로 둡니다.
+    """
+    enrichment = {
+        key: _collect_enrichment_result(future, pending_enrichment["fallbacks"][key], deadline)
+        for key, future in pending_enrichment["futures"].items()
+    }
+    enrichment["regret_risk_warnings"] = pending_enrichment["regret_risk_warnings"]
+    enrichment["pending_futures"] = [
+        future for future in pending_enrichment["futures"].values() if not future.done()
+    ]
+    return enrichment
+
+
+def load_lazy_enrichment(pending_enrichment, key: str, deadline=None):
+    """접힌 섹션용 조회를 처음 요청될 때 실행하고, 같은 묶음 안에서는 결과를 재사용합니다.
+
+    deadline까지 끝나지 않으면 (대체값, 진행 중인 작업)을, 끝났으면 (결과, None)을 반환합니다.
+    """
+    lazy_futures = pending_enrichment["lazy_futures"]
+    future = lazy_futures.get(key)
+    if future is None:
+        future = _get_enrichment_executor().submit(pending_enrichment["lazy"][key])
+        lazy_futures[key] = future
+    value = _collect_enrichment_result(future, pending_enrichment["fallbacks"][key], deadline)
+    return value, (None if future.done() else future)
+
+
+@st.fragment(run_every=PENDING_ENRICHMENT_POLL_SECONDS)
+def watch_pending_enrichments(pending_futures):
+    """시간 예산을 넘겨 대체값으로 그린 조회가 모두 끝나면 화면 전체를 다시 그려 결과를 채웁니다."""
+    if all(future.done() for future in pending_futures):
+        st.rerun(scope="app")
+
+
+# 결과 묶음의 각 항목이 어떤 입력에 의존하는지 나타냅니다. 입력이 바뀐 항목만 다시 계산합니다.
+BUNDLE_SECTION_DEPENDENCIES = {
+    "landmark_images": ("destination",),
+    "teleport_insight": ("destination",),
+    "weather_summary": ("destination", "weather_api_key"),
+    "regret_summary": ("destination", "style", "api_key"),
+    "festival_summary": ("destination",),
+    "entry_requirement": ("destination",),
+    "bgm": ("destination",),
+    "local_foods": ("destination",),
+    "seasonal_note": ("destination", "travel_dates"),
+    "climate_heatmap": ("destination", "travel_dates"),
+    "dated_itinerary": ("destination", "travel_dates"),
+    "flight_links": ("destination", "travel_dates"),
+    "budget": ("destination",),
+}
+
+
+def _input_fingerprint(value):
+    """API Key 같은 입력값을 세션 상태에 원문 그대로 두지 않도록 짧은 지문으로 바꿉니다."""
+    return hashlib.sha256(str(value or "").encode("utf-8")).hexdigest()[:16]
+
+
+def _build_bundle_inputs(dest, travel_dates, style: str, api_key: str, weather_api_key: str):
+    return {
+        "destination": _input_fingerprint(json.dumps(dest, sort_keys=True, ensure_ascii=False, default=str)),
+        "travel_dates": tuple(str(day) for day in travel_dates) if travel_dates else (),
+        "style": style,
+        "api_key": _input_fingerprint(api_key),
+        "weather_api_key": _input_fingerprint(weather_api_key),
+    }
+
+
+def _build_bundle_derived(dest, travel_dates, sections, climate_outlook):
+    """여행지 원본과 여행 날짜만으로 계산하는 표시용 값 중 sections에 해당하는 것만 만듭니다."""
+    builders = {
+        "seasonal_note": lambda: get_seasonal_travel_note(climate_outlook),
+        "climate_heatmap": lambda: build_climate_heatmap(climate_outlook),
+        "dated_itinerary": lambda: tuple(format_itinerary_with_dates(dest.get('itinerary', []), travel_dates)),
+        "flight_links": lambda: MappingProxyType(
+            build_flight_search_links(dest['name_kr'], dest['airport_code'], travel_dates)
+        ),
+        "budget": lambda: (build_budget_range_summary(dest['total_budget']), to_manwon_text(dest['total_budget'])),
+    }
+    return {key: builder() for key, builder in builders.items() if key in sections}
+
+
+# 기후 행렬(build_climate_outlooks)이 있어야 다시 만들 수 있는 항목입니다.
+CLIMATE_BUNDLE_SECTIONS = frozenset({"seasonal_note", "climate_heatmap"})
+
+
+def _stale_bundle_sections(previous, inputs):
+    """이전 묶음과 비교해 입력이 바뀌어 다시 계산해야 하는 항목 이름 집합을 반환합니다."""
+    return {
+        section
+        for section, dependencies in BUNDLE_SECTION_DEPENDENCIES.items()
+        if previous is None or any(previous["inputs"][name] != inputs[name] for name in dependencies)
+    }
+
+
+def build_destination_bundle(dest, travel_dates, style: str, api_key: str, weather_api_key: str, previous=None, pending_enrichment=None, climate_outlook=None):
+    """여행지 1곳의 조회 작업과 표시용 값을 묶은 읽기 전용 결과 묶음을 만듭니다.
+
+    previous가 같은 여행지의 이전 묶음이면, 바뀐 입력에 의존하는 항목만 새로 계산하고 나머지는 그대로 이어받습니다.
+    기후 항목을 다시 계산해야 할 때는 climate_outlook을 함께 넘겨야 합니다.
+    """
+    inputs = _build_bundle_inputs(dest, travel_dates, style, api_key, weather_api_key)
+    if previous is not None and previous["inputs"]["destination"] != inputs["destination"]:
+        previous = None
+
+    stale = _stale_bundle_sections(previous, inputs)
+    if previous is not None and not stale:
+        return previous
+
+    if pending_enrichment is None:
+        reuse = {}
+        if previous is not None:
+            previous_enrichment = previous["enrichment"]
+            reuse = {
+                key: future
+                for futures in (previous_enrichment["futures"], previous_enrichment["lazy_futures"])
+                for key, future in futures.items()
+                if key not in stale
+            }
+        pending_enrichment = start_destination_enrichment(dest, style, api_key, weather_api_key, reuse=reuse)
+
+    derived = {} if previous is None else dict(previous["derived"])
+    derived.update(_build_bundle_derived(dest, travel_dates, stale, climate_outlook))
+
+    return MappingProxyType(
+        {
+            "inputs": MappingProxyType(inputs),
+            "enrichment": pending_enrichment,
+            "derived": MappingProxyType(derived),
+        }
+    )
+
+
+def get_destination_bundles(destinations, travel_dates, style: str, api_key: str, weather_api_key: str, pending_enrichments=None):
+    """세션에 보관한 결과 묶음을 현재 입력에 맞게 갱신해 반환합니다.
+
+    입력이 그대로면 이전 묶음을 다시 쓰므로, 위젯 조작으로 인한 재실행은 화면만 다시 그립니다.
+    """
+    previous_bundles = {
+        bundle["inputs"]["destination"]: bundle for bundle in st.session_state.destination_bundles
+    }
+    previous_list = []
+    climate_indexes = []
+    for idx, dest in enumerate(destinations):
+        inputs = _build_bundle_inputs(dest, travel_dates, style, api_key, weather_api_key)
+        previous = previous_bundles.get(inputs["destination"])
+        previous_list.append(previous)
+        if CLIMATE_BUNDLE_SECTIONS & _stale_bundle_sections(previous, inputs):
+            climate_indexes.append(idx)
+
+    # 기후 항목을 다시 계산해야 하는 여행지만 모아 한 번에 행렬을 계산합니다.
+    climate_outlooks = dict(
+        zip(climate_indexes, build_climate_outlooks([destinations[idx] for idx in climate_indexes], travel_dates))
+    )
+    bundles = []
+    for idx, dest in enumerate(destinations):
+        bundles.append(
+            build_destination_bundle(
+                dest,
+                travel_dates,
+                style,
+                api_key,
+                weather_api_key,
+                previous=previous_list[idx],
+                pending_enrichment=pending_enrichments[idx] if pending_enrichments else None,
+                climate_outlook=climate_outlooks.get(idx),
+            )
+        )
+
+    st.session_state.destination_bundles = bundles
+    return bundles
+
+
+class DestinationStreamParser:
+    """스트리밍 중인 JSON 응답에서 destinations 배열의 여행지 객체를 완성되는 즉시 꺼냅니다.
+
+    지금까지 받은 텍스트를 한 번만 훑으면서 문자열/이스케이프/중괄호 깊이를 추적하므로,
+    응답 전체가 끝나기 전에도 닫힌 객체부터 순서대로 반환할 수 있습니다.
+    """
+
+    _ARRAY_START_PATTERN = re.compile(r'"destinations"\s*:\s*\[')
+
+    def __init__(self):
+        self.text = ""
+        self._cursor = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._object_start = None
+        self._closed = False
+
+    def feed(self, chunk: str):
+        """새로 받은 텍스트 조각을 더하고, 이번에 완성된 여행지 객체 목록을 반환합니다."""
+        self.text += chunk
+        completed = []
+
+        if self._closed:
+            return completed
+
+        if self._cursor is None:
+            match = self._ARRAY_START_PATTERN.search(self.text)
+            if not match:
+                return completed
+            self._cursor = match.end()
+
+        while self._cursor < len(self.text):
+            char = self.text[self._cursor]
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                if self._depth == 0:
+                    self._object_start = self._cursor
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0 and self._object_start is not None:
+                    raw_object = self.text[self._object_start:self._cursor + 1]
+                    self._object_start = None
+                    try:
+                        completed.append(json.loads(raw_object))
+                    except ValueError:
+                        pass
+            elif char == "]" and self._depth == 0:
+                self._closed = True
+                break
+
+            self._cursor += 1
+
+        return completed
+
+    def parse_complete(self):
+        """스트림이 끝난 뒤 받은 텍스트 전체를 다시 파싱해 destinations 목록을 반환합니다.
+
+        점진 파싱에서 건너뛴 객체가 없는지 확인하는 용도이며, 전체를 파싱할 수 없으면 None을 반환합니다.
+        """
+        try:
+            destinations = json.loads(self.text)["destinations"]
+        except (ValueError, KeyError, TypeError):
+            return None
+        return destinations if isinstance(destinations, list) else None
+
+
+def _render_entry_requirement_section(entry_requirement):
+    _, entry_info, is_search_based = entry_requirement
+    st.markdown(
+        f"""
+        - **비자 필요 여부**: {entry_info['visa']}
+        - **체류 가능 기간**: {entry_info['stay']}
+        - **ESTA / ETA 필요 여부**: {entry_info['eta']}
+        - **여권 유효기간 조건**: {entry_info['passport']}
+        """
+    )
+    if is_search_based:
+        st.caption("※ 위 정보는 실시간 검색 요약입니다. 예약/출국 전 외교부 해외안전여행 및 해당국 대사관 공지로 최종 확인하세요.")
+        if entry_info.get("source"):
+            st.link_button("🔎 참고 링크(검색 결과)", entry_info["source"])
+
+
+def _render_festival_section(festival_summary):
+    st.markdown(festival_summary)
+
+
+def _render_bgm_section(bgm):
+    bgm_title, bgm_url = bgm
+    st.caption(bgm_title)
+    st.video(bgm_url)
+
+
+def _render_itinerary_section(dest, dated_itinerary, local_foods):
+    col_a, col_b = st.columns(2)
+    with col_a:
+        st.markdown("#### 🗓️ 추천 일정")
+        for item in dated_itinerary:
+            st.markdown(f"- {item}")
+
+        if local_foods:
+            st.markdown("#### 🍽️ 추천 음식 / 로컬 푸드")
+            meal_cols = st.columns(min(3, len(local_foods)))
+            for idx, meal in enumerate(local_foods[:3]):
+                with meal_cols[idx]:
+                    st.markdown(f"**{meal['name']}**")
+                    if meal.get("image"):
+                        st.image(meal["image"], width=160)
+
+    with col_b:
+        st.markdown("#### 💰 예상 예산")
+        st.success(f"**{dest['total_budget']}**")
+        budget_items = dest.get('budget_detail', [])
+        if isinstance(budget_items, list):
+            for item in budget_items:
+                st.caption(f"• {item}")
+        else:
+            st.caption(budget_items)
+
+
+@st.fragment
+def render_lazy_section(label: str, widget_key: str, pending_enrichment, section: str, render_body, deadline):
+    """접힌 상세 섹션을 그리고, 사용자가 펼쳤을 때만 조회를 실행해 내용을 채웁니다.
+
+    펼치거나 접으면 이 프래그먼트만 다시 실행되므로 나머지 화면은 다시 그리지 않습니다.
+    화면 전체를 그릴 때는 결과 화면의 deadline을 함께 쓰고, 프래그먼트만 다시 실행될 때만 새 예산을 잡습니다.
+    """
+    # 결과 화면은 전체 실행마다 lazy_sections_rendered를 비우므로,
+    # 이번 실행에서 이미 그린 섹션이 다시 실행됐다면 프래그먼트 단독 재실행입니다.
+    if widget_key in st.session_state.lazy_sections_rendered:
+        deadline = time.monotonic() + RENDER_LATENCY_BUDGET_SECONDS
+    st.session_state.lazy_sections_rendered.add(widget_key)
+
+    expander = st.expander(label, expanded=False, key=widget_key, on_change="rerun")
+    with expander:
+        if not expander.open:
+            return
+        with st.spinner("정보를 불러오는 중이에요..."):
+            value, pending_future = load_lazy_enrichment(pending_enrichment, section, deadline)
+        render_body(value)
+        if pending_future is not None:
+            st.caption("⏳ 아직 불러오는 중이에요. 준비되면 자동으로 채워집니다.")
+            watch_pending_enrichments([pending_future])
+
+
+def render_destination_preview(destinations, expected_count: int = 3):
+    """스트리밍으로 도착한 여행지를 세부 정보 조회 전 미리보기 탭으로 보여줍니다."""
+    labels = [extract_place_name(d.get('name_kr', '여행지')) for d in destinations]
+    labels += ["⏳ 추천 중..."] * max(0, expected_count - len(destinations))
+    tabs = st.tabs(labels)
+
+    for tab, dest in zip(tabs, destinations):
+        with tab:
+            st.header(f"📍 {dest.get('name_kr', '여행지')}")
+            st.info(f"💡 **추천 이유**: {dest.get('reason', '추천 이유 없음')}")
+            st.caption("날씨·이미지·입국 조건 등 세부 정보를 불러오는 중이에요...")
+
+    for tab in tabs[len(destinations):]:
+        with tab:
+            st.caption("다음 여행지를 고르는 중이에요...")
+
+
+def render_destination_results(destinations, duration_label, bundles):
     st.success(f"'{duration_label}' 동안 다녀오기 좋은, 전 세계 여행지를 엄선했습니다! 🌍")
 
     tabs = st.tabs([extract_place_name(d['name_kr']) for d in destinations])
 
+    # 세 여행지가 하나의 시간 예산을 나눠 쓰며, 예산을 넘긴 조회는 대체값으로 먼저 그립니다.
+    deadline = time.monotonic() + RENDER_LATENCY_BUDGET_SECONDS
+    st.session_state.lazy_sections_rendered = set()
+    pending_futures = []
+
     for i, tab in enumerate(tabs):
         with tab:
             dest = destinations[i]
+            bundle = bundles[i]
+            derived = bundle["derived"]
             st.header(f"📍 {dest['name_kr']}")
 
-            map_data = pd.DataFrame({'lat': [dest['latitude']], 'lon': [dest['longitude']]})
+            map_data = {'lat': [dest['latitude']], 'lon': [dest['longitude']]}
             st.map(map_data, zoom=4)
 
-            landmark_images = get_landmark_images(dest['name_kr'], limit=3)
-            teleport_insight = get_teleport_city_insights(dest['name_kr'])
+            enrichment = collect_destination_enrichment(bundle["enrichment"], deadline)
+            pending_futures.extend(enrichment["pending_futures"])
+            if enrichment["pending_futures"]:
+                st.caption("⏳ 일부 정보는 아직 불러오는 중이라 기본 안내로 먼저 보여드려요. 준비되면 자동으로 채워집니다.")
+            landmark_images = enrichment["landmark_images"]
+            teleport_insight = enrichment["teleport_insight"]
 
             if landmark_images:
                 st.markdown("#### 🖼️ 여행지 대표 이미지")
@@ -2251,28 +3453,19 @@ def render_destination_results(destinations, duration_label, selected_travel_dat
                             category_rows.append({"구분": "강점", "지표": category_name, "점수(0~10)": score})
                         for category_name, score in bottom_categories:
                             category_rows.append({"구분": "유의", "지표": category_name, "점수(0~10)": score})
-                        st.dataframe(pd.DataFrame(category_rows), hide_index=True, use_container_width=True)
+                        st.dataframe(category_rows, hide_index=True, use_container_width=True)
 
                     if teleport_insight.get("teleport_url"):
                         st.link_button("🔗 Teleport 도시 프로필 보기", teleport_insight["teleport_url"])
 
-            regret_risk_warnings = get_regret_risk_warnings(style, dest['name_kr'], dest['reason'])
-            weather_summary = get_weather_summary(dest['latitude'], dest['longitude'], weather_api_key)
-            seasonal_note = get_seasonal_travel_note(dest['name_kr'], dest['latitude'], selected_travel_dates)
-            festival_summary = get_festival_summary(dest['name_kr'])
-            country, entry_info, is_search_based = get_entry_requirement_for_korean_passport(dest['name_kr'])
+            regret_risk_warnings = enrichment["regret_risk_warnings"]
+            weather_summary = enrichment["weather_summary"]
+            seasonal_note = derived["seasonal_note"]
 
-            regret_ratings, regret_one_liner = build_regret_summary(
-                api_key,
-                dest['name_kr'],
-                dest['reason'],
-                regret_risk_warnings,
-                teleport_insight,
-            )
+            regret_ratings, regret_one_liner = enrichment["regret_summary"]
             regret_risk_warnings = ensure_minimum_regret_warning(regret_risk_warnings)
             weather_emoji, weather_core = build_weather_emoji_display(weather_summary)
-            budget_summary = build_budget_range_summary(dest['total_budget'])
-            total_budget_in_manwon = to_manwon_text(dest['total_budget'])
+            budget_summary, total_budget_in_manwon = derived["budget"]
 
             st.markdown("#### ✅ 상단 요약")
             metric_col1, metric_col2, metric_col3 = st.columns(3)
@@ -2307,63 +3500,53 @@ def render_destination_results(destinations, duration_label, selected_travel_dat
                 st.write(weather_summary)
                 st.markdown("#### 🌦️ 여행 기간 기후/시기 적합성")
                 st.markdown(seasonal_note)
-
-            flight_links = build_flight_search_links(dest['name_kr'], dest['airport_code'], selected_travel_dates)
-
-            with st.expander("🛂 비자/입국 조건", expanded=False):
-                st.markdown(
-                    f"""
-                    - **비자 필요 여부**: {entry_info['visa']}
-                    - **체류 가능 기간**: {entry_info['stay']}
-                    - **ESTA / ETA 필요 여부**: {entry_info['eta']}
-                    - **여권 유효기간 조건**: {entry_info['passport']}
-                    """
-                )
-                if is_search_based:
-                    st.caption("※ 위 정보는 실시간 검색 요약입니다. 예약/출국 전 외교부 해외안전여행 및 해당국 대사관 공지로 최종 확인하세요.")
-                    if entry_info.get("source"):
-                        st.link_button("🔎 참고 링크(검색 결과)", entry_info["source"])
-
-            with st.expander("🎉 축제/이벤트", expanded=False):
-                st.markdown(festival_summary)
-
-            bgm_title, bgm_url = get_destination_bgm(dest['name_kr'])
-            with st.expander("🎵 여행지 무드 BGM", expanded=False):
-                st.caption(bgm_title)
-                st.video(bgm_url)
-
-            with st.expander("🗓️ 일정/예산 상세", expanded=False):
-                col_a, col_b = st.columns(2)
-                with col_a:
-                    st.markdown("#### 🗓️ 추천 일정")
-                    itinerary_items = dest.get('itinerary', [])
-                    dated_itinerary = format_itinerary_with_dates(itinerary_items, selected_travel_dates)
-                    for item in dated_itinerary:
-                        st.markdown(f"- {item}")
-
-                    local_foods = get_local_food_recommendations(dest['name_kr'])
-                    if local_foods:
-                        st.markdown("#### 🍽️ 추천 음식 / 로컬 푸드")
-                        meal_cols = st.columns(min(3, len(local_foods)))
-                        for idx, meal in enumerate(local_foods[:3]):
-                            with meal_cols[idx]:
-                                st.markdown(f"**{meal['name']}**")
-                                if meal.get("image"):
-                                    st.image(meal["image"], width=160)
-
-                with col_b:
-                    st.markdown("#### 💰 예상 예산")
-                    st.success(f"**{dest['total_budget']}**")
-                    budget_items = dest.get('budget_detail', [])
-                    if isinstance(budget_items, list):
-                        for item in budget_items:
-                            st.caption(f"• {item}")
-                    else:
-                        st.caption(budget_items)
+                climate_heatmap, best_period_caption = derived["climate_heatmap"]
+                st.markdown("#### 📅 월별 여행 적합도")
+                st.markdown(climate_heatmap, unsafe_allow_html=True)
+                st.caption(best_period_caption)
+
+            flight_links = derived["flight_links"]
+
+            section_key_suffix = f"{i}_{dest['name_kr']}"
+            render_lazy_section(
+                "🛂 비자/입국 조건",
+                f"lazy_entry_{section_key_suffix}",
+                bundle["enrichment"],
+                "entry_requirement",
+                _render_entry_requirement_section,
+                deadline,
+            )
+            render_lazy_section(
+                "🎉 축제/이벤트",
+                f"lazy_festival_{section_key_suffix}",
+                bundle["enrichment"],
+                "festival_summary",
+                _render_festival_section,
+                deadline,
+            )
+            render_lazy_section(
+                "🎵 여행지 무드 BGM",
+                f"lazy_bgm_{section_key_suffix}",
+                bundle["enrichment"],
+                "bgm",
+                _render_bgm_section,
+                deadline,
+            )
+            render_lazy_section(
+                "🗓️ 일정/예산 상세",
+                f"lazy_itinerary_{section_key_suffix}",
+                bundle["enrichment"],
+                "local_foods",
+                functools.partial(_render_itinerary_section, dest, derived["dated_itinerary"]),
+                deadline,
+            )
 
             st.markdown("---")
             st.link_button(f"✈️ {extract_place_name(dest['name_kr'])} 항공권 검색", flight_links["skyscanner"])
 
+    if pending_futures:
+        watch_pending_enrichments(pending_futures)
+
     st.markdown("---")
     st.markdown("#### 🗳️ 친구들에게 투표받기")
     share_options = [f"{idx + 1}. {d['name_kr']}" for idx, d in enumerate(destinations[:3])]
@@ -2377,13 +3560,16 @@ def render_destination_results(destinations, duration_label, selected_travel_dat
 
 # 4. 추천 버튼
 recommend_clicked = st.button("🚀 여행지 3곳 추천받기")
+record_script_timing("first_paint", time.perf_counter() - SCRIPT_STARTED_AT)
+streamed_pending_enrichments = None
 if recommend_clicked:
     if not api_key:
         st.error("⚠️ 사이드바에 OpenAI API Key를 먼저 입력해주세요!")
     else:
+        results_placeholder = st.empty()
         with st.spinner("AI가 전 세계 지도를 펼쳐 놓고 고민 중입니다..."):
             try:
-                client = OpenAI(api_key=api_key)
+                client = get_openai_client(api_key)
 
                 # 프롬프트 수정: 장거리 여행 시 대륙 제한 해제
                 prompt = f"""
@@ -2456,29 +3642,76 @@ if recommend_clicked:
                 """
 
                 # temperature 1.1 유지 (다양성)
-                response = client.chat.completions.create(
+                response_stream = client.chat.completions.create(
                     model="gpt-4o-mini",
                     messages=[{"role": "user", "content": prompt}],
                     response_format={"type": "json_object"},
                     temperature=1.1,
+                    stream=True,
                 )
 
-                result = json.loads(response.choices[0].message.content)
-                destinations = result['destinations']
+                # 여행지 객체가 완성되는 즉시 미리보기 탭을 그리고 부가 정보 조회를 시작합니다.
+                destinations = []
+                pending_enrichments = []
+                stream_parser = DestinationStreamParser()
+                for chunk in response_stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+
+                    for dest in stream_parser.feed(delta):
+                        destinations.append(dest)
+                        pending_enrichments.append(
+                            start_destination_enrichment(dest, style, api_key, weather_api_key)
+                        )
+                        with results_placeholder.container():
+                            render_destination_preview(destinations)
+
+                # 점진 파싱에서 빠진 여행지가 있으면 전체 응답 기준으로 바로잡고, 이미 시작한 조회는 이어 씁니다.
+                complete_destinations = stream_parser.parse_complete()
+                if complete_destinations is None and not destinations:
+                    raise ValueError("추천 결과(JSON)를 해석하지 못했습니다.")
+                if complete_destinations is not None and complete_destinations != destinations:
+                    streamed = list(zip(destinations, pending_enrichments))
+                    destinations = complete_destinations
+                    pending_enrichments = [
+                        next((pending for streamed_dest, pending in streamed if streamed_dest == dest), None)
+                        or start_destination_enrichment(dest, style, api_key, weather_api_key)
+                        for dest in destinations
+                    ]
+
                 st.session_state.latest_destinations = destinations
                 st.session_state.latest_duration = duration
                 st.session_state.latest_travel_dates = travel_dates
+                streamed_pending_enrichments = pending_enrichments
 
             except Exception as e:
                 st.error(f"오류가 발생했습니다: {e}")
 
+        results_placeholder.empty()
+
 
 if st.session_state.latest_destinations:
     stored_duration = st.session_state.latest_duration or duration
     stored_travel_dates = st.session_state.latest_travel_dates or travel_dates
-    render_destination_results(st.session_state.latest_destinations, stored_duration, stored_travel_dates)
+    destination_bundles = get_destination_bundles(
+        st.session_state.latest_destinations,
+        stored_travel_dates,
+        style,
+        api_key,
+        weather_api_key,
+        pending_enrichments=streamed_pending_enrichments,
+    )
+    render_destination_results(st.session_state.latest_destinations, stored_duration, destination_bundles)
 
-if st.session_state.chat_open:
+
+@st.fragment
+def render_chat_popup(api_key: str, profile_summary: str):
+    """재추천 챗봇 팝업을 그립니다.
+
+    프래그먼트로 분리해 두었기 때문에 메시지를 보내도 챗봇 영역만 다시 실행되고,
+    여행지 탭과 그 안의 외부 조회는 다시 그리지 않습니다.
+    """
     chat_container = st.container(border=True, key="cloud_chat_popup")
     with chat_container:
         st.markdown("### ☁️ 재추천 챗봇")
@@ -2487,34 +3720,48 @@ if st.session_state.chat_open:
             with st.chat_message(message["role"]):
                 st.markdown(message["content"])
 
-        user_feedback = st.text_input(
-            "메시지 입력",
-            key="cloud_chat_input",
-            label_visibility="collapsed",
-            placeholder="예: 재추천해줘 / 오사카 3박4일 일정 짜줘 / 비 오는 날 갈만한 관광지 추천해줘",
-        )
-        send_clicked = st.button("전송", key="cloud_chat_send")
+        new_turn_container = st.container()
+
+        # clear_on_submit 폼을 쓰면 입력창을 비우기 위한 추가 st.rerun()이 필요 없습니다.
+        with st.form("cloud_chat_form", clear_on_submit=True, border=False):
+            user_feedback = st.text_input(
+                "메시지 입력",
+                key="cloud_chat_input",
+                label_visibility="collapsed",
+                placeholder="예: 재추천해줘 / 오사카 3박4일 일정 짜줘 / 비 오는 날 갈만한 관광지 추천해줘",
+            )
+            send_clicked = st.form_submit_button("전송", key="cloud_chat_send")
 
     if send_clicked and user_feedback.strip():
         user_feedback = user_feedback.strip()
         st.session_state.chat_messages.append({"role": "user", "content": user_feedback})
 
-        profile_summary = (
-            f"기간={duration}, 난이도={difficulty}, 스타일={style}, 예산={budget_level}, 동행={companion}, 운전={no_drive}, 추가요청={etc_req or '없음'}"
-        )
-
-        with st.spinner("피드백 반영해서 다시 골라볼게요..."):
-            try:
-                reply = get_followup_recommendations(
-                    api_key=api_key,
-                    user_message=user_feedback,
-                    destinations=st.session_state.latest_destinations,
-                    profile_summary=profile_summary,
-                    chat_history=st.session_state.chat_messages,
-                )
-            except Exception as e:
-                reply = f"재추천 중 오류가 발생했어요: {e}"
+        with new_turn_container:
+            with st.chat_message("user"):
+                st.markdown(user_feedback)
+
+            with st.chat_message("assistant"):
+                try:
+                    reply = st.write_stream(
+                        stream_followup_recommendations(
+                            api_key=api_key,
+                            user_message=user_feedback,
+                            destinations=st.session_state.latest_destinations,
+                            profile_summary=profile_summary,
+                            chat_history=st.session_state.chat_messages,
+                        )
+                    )
+                except Exception as e:
+                    reply = f"재추천 중 오류가 발생했어요: {e}"
+                    st.markdown(reply)
 
         st.session_state.chat_messages.append({"role": "assistant", "content": reply})
-        st.session_state.cloud_chat_input = ""
-        st.rerun()
+
+
+if st.session_state.chat_open:
+    render_chat_popup(
+        api_key,
+        f"기간={duration}, 난이도={difficulty}, 스타일={style}, 예산={budget_level}, 동행={companion}, 운전={no_drive}, 추가요청={etc_req or '없음'}",
+    )
+
+record_script_timing("script", time.perf_counter() - SCRIPT_STARTED_AT)
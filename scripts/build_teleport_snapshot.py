@@ -0,0 +1,79 @@
+"""Teleport urban area 점수/요약/사진을 data/teleport_snapshot.json으로 내려받습니다.
+
+앱은 이 스냅샷에 있는 도시의 인사이트를 Teleport API 호출 없이 메모리에서 바로 반환합니다.
+스냅샷 형식이 바뀌면 SNAPSHOT_VERSION을 올려 주세요.
+
+    python scripts/build_teleport_snapshot.py
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import requests
+
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "teleport_snapshot.json")
+URBAN_AREAS_ENDPOINT = "https://api.teleport.org/api/urban_areas/"
+
+
+def fetch_json(session: requests.Session, url: str):
+    response = session.get(url, timeout=12)
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch_urban_area(session: requests.Session, href: str):
+    """urban area 1곳의 상세/점수/사진을 스냅샷 항목으로 변환합니다."""
+    detail = fetch_json(session, href)
+    scores = fetch_json(session, f"{href}scores/")
+    images = fetch_json(session, f"{href}images/")
+
+    slug = detail.get("slug") or href.rstrip("/").split("slug:")[-1]
+    countries = [country.get("name") for country in detail.get("_links", {}).get("ua:countries", []) if country.get("name")]
+    full_name = detail.get("full_name", "")
+
+    return slug, {
+        "name": detail.get("name", slug),
+        "countries": countries,
+        "aliases": [full_name] if full_name else [],
+        "scores": {
+            "summary": scores.get("summary", ""),
+            "teleport_city_score": scores.get("teleport_city_score"),
+            "teleport_city_url": scores.get("teleport_city_url"),
+            "categories": [
+                {"name": category.get("name"), "score_out_of_10": category.get("score_out_of_10")}
+                for category in scores.get("categories", [])
+            ],
+        },
+        "image_url": images.get("photos", [{}])[0].get("image", {}).get("web"),
+        "source": href,
+    }
+
+
+def main():
+    with requests.Session() as session:
+        index = fetch_json(session, URBAN_AREAS_ENDPOINT)
+        hrefs = [item["href"] for item in index.get("_links", {}).get("ua:item", []) if item.get("href")]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            urban_areas = dict(executor.map(lambda href: fetch_urban_area(session, href), hrefs))
+
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "source": URBAN_AREAS_ENDPOINT,
+        "urban_areas": dict(sorted(urban_areas.items())),
+    }
+
+    with open(SNAPSHOT_PATH, "w", encoding="utf-8") as snapshot_file:
+        json.dump(snapshot, snapshot_file, ensure_ascii=False, indent=2)
+        snapshot_file.write("\n")
+
+    print(f"urban area {len(urban_areas)}곳을 {SNAPSHOT_PATH}에 저장했습니다.")
+
+
+if __name__ == "__main__":
+    main()
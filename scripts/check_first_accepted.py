@@ -0,0 +1,121 @@
+"""first_accepted_by_priority가 앞선 후보를 기다리는 동안 CPU를 태우지 않는지 점검합니다.
+
+앞선 후보는 느리고 뒤 후보는 먼저 끝나는 경우를 기본/hedge_delay/max_in_flight 모드로 실행해,
+기다리는 동안 쓴 CPU 시간이 벽시계 시간의 일부에 그치는지 확인합니다.
+BGM 후보 확인과 같은 설정(max_in_flight=BGM_PROBE_WINDOW)에서는 동시에 진행된 후보 수도 확인합니다.
+app.py 전체를 실행하지 않도록 함수 정의만 꺼내 별도 스레드 풀과 함께 실행합니다.
+
+    python scripts/check_first_accepted.py
+"""
+
+import ast
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT_DIR, "app.py")
+HEAD_SECONDS = 1.0
+MAX_CPU_RATIO = 0.2
+
+MODES = [
+    ("기본", {}),
+    ("hedge_delay=0.3", {"hedge_delay": 0.3}),
+    ("max_in_flight=2", {"max_in_flight": 2}),
+]
+
+
+def load_app_tree():
+    with open(APP_PATH, encoding="utf-8") as app_file:
+        return ast.parse(app_file.read(), APP_PATH)
+
+
+def load_bgm_probe_window(tree):
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(target, "id", None) == "BGM_PROBE_WINDOW" for target in node.targets):
+            return ast.literal_eval(node.value)
+    raise LookupError("app.py에서 BGM_PROBE_WINDOW를 찾지 못했습니다.")
+
+
+def load_first_accepted_by_priority(tree, executor):
+    node = next(
+        node for node in tree.body
+        if isinstance(node, ast.FunctionDef) and node.name == "first_accepted_by_priority"
+    )
+    namespace = {
+        "time": time,
+        "wait": wait,
+        "FIRST_COMPLETED": FIRST_COMPLETED,
+        "_get_fanout_executor": lambda: executor,
+    }
+    exec(compile(ast.Module(body=[node], type_ignores=[]), APP_PATH, "exec"), namespace)
+    return namespace["first_accepted_by_priority"]
+
+
+def check_bgm_probe_window(first_accepted_by_priority, probe_window: int):
+    """느린 첫 후보 뒤에 실패 후보가 이어질 때 동시에 확인하는 후보 수가 창 크기를 넘지 않는지 봅니다."""
+    lock = threading.Lock()
+    counters = {"running": 0, "peak": 0}
+
+    def probe(delay: float, playable: bool):
+        def run():
+            with lock:
+                counters["running"] += 1
+                counters["peak"] = max(counters["peak"], counters["running"])
+            time.sleep(delay)
+            with lock:
+                counters["running"] -= 1
+            return playable
+        return run
+
+    calls = [("첫 후보", probe(HEAD_SECONDS, True))]
+    calls += [(f"후보 {index}", probe(0.01, False)) for index in range(2, 8)]
+
+    cpu_started_at = time.thread_time()
+    wall_started_at = time.perf_counter()
+    winner, _ = first_accepted_by_priority(calls, max_in_flight=probe_window)
+    cpu_seconds = time.thread_time() - cpu_started_at
+    wall_seconds = time.perf_counter() - wall_started_at
+
+    ok = winner == "첫 후보" and counters["peak"] <= probe_window and cpu_seconds <= wall_seconds * MAX_CPU_RATIO
+    print(
+        f"  {'통과' if ok else '실패'}: BGM 후보 확인(max_in_flight={probe_window}) / 선택={winner} / "
+        f"최대 동시 {counters['peak']}개 / 대기 {wall_seconds:.2f}초 동안 CPU {cpu_seconds:.3f}초"
+    )
+    return ok
+
+
+def main():
+    failed = False
+    tree = load_app_tree()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        first_accepted_by_priority = load_first_accepted_by_priority(tree, executor)
+        calls = [
+            ("느린 첫 후보", lambda: time.sleep(HEAD_SECONDS) or True),
+            ("빠른 두 번째 후보", lambda: True),
+        ]
+        for mode, options in MODES:
+            wall_started_at = time.perf_counter()
+            cpu_started_at = time.thread_time()
+            winner, _ = first_accepted_by_priority(calls, **options)
+            cpu_seconds = time.thread_time() - cpu_started_at
+            wall_seconds = time.perf_counter() - wall_started_at
+
+            ok = winner == "느린 첫 후보" and cpu_seconds <= wall_seconds * MAX_CPU_RATIO
+            failed = failed or not ok
+            print(
+                f"  {'통과' if ok else '실패'}: {mode} / 선택={winner} / "
+                f"대기 {wall_seconds:.2f}초 동안 CPU {cpu_seconds:.3f}초"
+            )
+
+        if not check_bgm_probe_window(first_accepted_by_priority, load_bgm_probe_window(tree)):
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Teleport 스냅샷 조회 경로를 네트워크 없이 점검합니다.
+
+샘플 스냅샷(data/teleport_snapshot.sample.json)을 앱에 연결해 한국어 여행지명이
+별칭 정규화를 거쳐 스냅샷 도시로 연결되고, 화면에 도시 인사이트가 표시되는지 확인합니다.
+다른 스냅샷 파일을 점검하려면 경로를 인자로 넘기세요.
+
+    python scripts/check_teleport_snapshot.py [snapshot.json]
+"""
+
+import os
+import sys
+import tempfile
+
+from streamlit.testing.v1 import AppTest
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT_DIR, "app.py")
+SAMPLE_SNAPSHOT_PATH = os.path.join(ROOT_DIR, "data", "teleport_snapshot.sample.json")
+
+# (화면에 쓰는 여행지명, 샘플 스냅샷에서 기대하는 요약 문구)
+EXPECTED_SNAPSHOT_HITS = [
+    ("파리 (프랑스)", "스냅샷 점검용 샘플 요약: Paris"),
+    ("뉴욕 (미국)", "스냅샷 점검용 샘플 요약: New York"),
+]
+
+
+def build_destination(name_kr: str):
+    return {
+        "name_kr": name_kr,
+        "airport_code": "",
+        "latitude": 40.0,
+        "longitude": 0.0,
+        "reason": "스냅샷 점검",
+        "itinerary": ["DAY 1: 자유 일정"],
+        "total_budget": "1,000,000원",
+        "budget_detail": [],
+    }
+
+
+def main():
+    snapshot_path = os.path.abspath(sys.argv[1]) if len(sys.argv) > 1 else SAMPLE_SNAPSHOT_PATH
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ["NOREGRET_TELEPORT_SNAPSHOT"] = snapshot_path
+        os.environ["NOREGRET_CACHE_DIR"] = cache_dir
+
+        app = AppTest.from_file(APP_PATH, default_timeout=120)
+        app.session_state["latest_destinations"] = [build_destination(name) for name, _ in EXPECTED_SNAPSHOT_HITS]
+        app.run()
+
+    if app.exception:
+        print(f"앱 실행 중 예외가 발생했습니다: {app.exception}")
+        return 1
+
+    rendered = "\n".join(element.value for element in app.markdown)
+    missing = [name for name, summary in EXPECTED_SNAPSHOT_HITS if summary not in rendered]
+    for name, _ in EXPECTED_SNAPSHOT_HITS:
+        print(f"  {'실패' if name in missing else '통과'}: {name}")
+
+    print(f"스냅샷 {snapshot_path} 조회 점검 {len(EXPECTED_SNAPSHOT_HITS) - len(missing)}/{len(EXPECTED_SNAPSHOT_HITS)}곳 통과")
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""data/bgm_catalog.json에 등록된 YouTube 링크의 재생 가능 여부를 다시 검증합니다.
+
+앱은 카탈로그의 available 값이 true인 링크를 네트워크 조회 없이 바로 사용하므로,
+배포 전이나 주기적으로 이 스크립트를 실행해 카탈로그를 최신 상태로 유지하세요.
+
+    python scripts/refresh_bgm_catalog.py
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import requests
+
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "bgm_catalog.json")
+OEMBED_ENDPOINT = "https://www.youtube.com/oembed"
+
+
+def is_youtube_video_available(session: requests.Session, url: str):
+    """YouTube oEmbed 응답으로 재생 가능한 영상인지 확인합니다. 네트워크 오류는 None으로 반환합니다."""
+    try:
+        response = session.get(OEMBED_ENDPOINT, params={"url": url, "format": "json"}, timeout=8)
+    except requests.RequestException:
+        return None
+    return response.status_code == 200
+
+
+def iter_catalog_entries(catalog):
+    for entries in catalog["city"].values():
+        yield from entries
+    for entries in catalog["country"].values():
+        yield from entries
+    yield from catalog["fallback"]
+    yield catalog["generic"]
+
+
+def main():
+    with open(CATALOG_PATH, encoding="utf-8") as catalog_file:
+        catalog = json.load(catalog_file)
+
+    entries = list(iter_catalog_entries(catalog))
+    urls = sorted({entry["url"] for entry in entries})
+
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=8) as executor:
+        results = dict(zip(urls, executor.map(lambda url: is_youtube_video_available(session, url), urls)))
+
+    checked_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    for entry in entries:
+        available = results[entry["url"]]
+        # 네트워크 오류로 확인하지 못한 링크는 이전 검증 결과를 유지합니다.
+        if available is not None:
+            entry["available"] = available
+            entry["checked_at"] = checked_at
+
+    if any(available is not None for available in results.values()):
+        catalog["refreshed_at"] = checked_at
+
+    with open(CATALOG_PATH, "w", encoding="utf-8") as catalog_file:
+        json.dump(catalog, catalog_file, ensure_ascii=False, indent=2)
+        catalog_file.write("\n")
+
+    unavailable = [url for url, available in results.items() if available is False]
+    unknown = [url for url, available in results.items() if available is None]
+    print(f"검증한 링크 {len(urls)}개 / 재생 불가 {len(unavailable)}개 / 확인 실패 {len(unknown)}개")
+    for url in unavailable:
+        print(f"  재생 불가: {url}")
+
+
+if __name__ == "__main__":
+    main()
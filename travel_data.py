@@ -0,0 +1,707 @@
+"""NoRegret Trip이 참고하는 정적 여행 지식 테이블입니다.
+
+Streamlit은 상호작용마다 app.py를 처음부터 다시 실행하지만, 이 모듈은 프로세스당 한 번만 import되어
+모든 세션이 같은 테이블을 공유합니다. 실수로 고치지 않도록 모든 테이블은 읽기 전용 구조로 감쌌습니다.
+내용을 바꾸면 TRAVEL_DATA_VERSION을 올려 주세요.
+"""
+
+from types import MappingProxyType
+
+
+TRAVEL_DATA_VERSION = 1
+
+
+def _freeze(value):
+    """dict/list를 재귀적으로 MappingProxyType/tuple로 바꿔 읽기 전용으로 만듭니다."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+COUNTRY_NAME_ALIASES = _freeze({
+    "일본": "japan",
+    "중국": "china",
+    "대만": "taiwan",
+    "홍콩": "hong kong",
+    "베트남": "vietnam",
+    "태국": "thailand",
+    "싱가포르": "singapore",
+    "말레이시아": "malaysia",
+    "미국": "united states",
+    "캐나다": "canada",
+    "영국": "united kingdom",
+    "프랑스": "france",
+    "독일": "germany",
+    "이탈리아": "italy",
+    "스페인": "spain",
+    "포르투갈": "portugal",
+    "네덜란드": "netherlands",
+    "크로아티아": "croatia",
+    "아이슬란드": "iceland",
+    "튀르키예": "turkey",
+    "아랍에미리트": "united arab emirates",
+    "호주": "australia",
+    "뉴질랜드": "new zealand",
+    "몽골": "mongolia",
+    "라오스": "laos",
+    "이집트": "egypt",
+    "필리핀": "philippines",
+    "인도네시아": "indonesia",
+    "인도": "india",
+    "스위스": "switzerland",
+    "오스트리아": "austria",
+    "체코": "czech republic",
+    "헝가리": "hungary",
+    "핀란드": "finland",
+    "노르웨이": "norway",
+    "덴마크": "denmark",
+    "벨기에": "belgium",
+    "아일랜드": "ireland",
+    "멕시코": "mexico",
+    "스웨덴": "sweden",
+    "폴란드": "poland",
+    "그리스": "greece",
+    "브라질": "brazil",
+    "아르헨티나": "argentina",
+    "칠레": "chile",
+    "페루": "peru",
+    "남아프리카공화국": "south africa",
+    "모로코": "morocco",
+    "카타르": "qatar",
+    "대한민국": "south korea",
+    "한국": "south korea",
+    "마카오": "macao",
+    "캄보디아": "cambodia",
+    "미얀마": "myanmar",
+    "네팔": "nepal",
+    "스리랑카": "sri lanka",
+    "우즈베키스탄": "uzbekistan",
+    "카자흐스탄": "kazakhstan",
+    "조지아": "georgia",
+})
+
+CITY_NAME_ALIASES = _freeze({
+    "도쿄": "tokyo",
+    "오사카": "osaka",
+    "교토": "kyoto",
+    "후쿠오카": "fukuoka",
+    "삿포로": "sapporo",
+    "나고야": "nagoya",
+    "베이징": "beijing",
+    "상하이": "shanghai",
+    "광저우": "guangzhou",
+    "선전": "shenzhen",
+    "타이베이": "taipei",
+    "가오슝": "kaohsiung",
+    "홍콩": "hong kong",
+    "하노이": "hanoi",
+    "호치민": "ho chi minh city",
+    "다낭": "da nang",
+    "방콕": "bangkok",
+    "푸켓": "phuket",
+    "싱가포르": "singapore",
+    "쿠알라룸푸르": "kuala lumpur",
+    "뉴욕": "new york",
+    "로스앤젤레스": "los angeles",
+    "샌프란시스코": "san francisco",
+    "밴쿠버": "vancouver",
+    "토론토": "toronto",
+    "런던": "london",
+    "파리": "paris",
+    "베를린": "berlin",
+    "로마": "rome",
+    "마드리드": "madrid",
+    "바르셀로나": "barcelona",
+    "리스본": "lisbon",
+    "암스테르담": "amsterdam",
+    "두브로브니크": "dubrovnik",
+    "레이캬비크": "reykjavik",
+    "이스탄불": "istanbul",
+    "두바이": "dubai",
+    "시드니": "sydney",
+    "멜버른": "melbourne",
+    "오클랜드": "auckland",
+    "울란바토르": "ulaanbaatar",
+    "비엔티안": "vientiane",
+    "카이로": "cairo",
+    "마닐라": "manila",
+    "세부": "cebu",
+    "발리": "bali",
+    "자카르타": "jakarta",
+    "델리": "delhi",
+    "뭄바이": "mumbai",
+    "취리히": "zurich",
+    "빈": "vienna",
+    "프라하": "prague",
+    "부다페스트": "budapest",
+    "헬싱키": "helsinki",
+    "오슬로": "oslo",
+    "코펜하겐": "copenhagen",
+    "브뤼셀": "brussels",
+    "더블린": "dublin",
+    "스톡홀름": "stockholm",
+    "바르샤바": "warsaw",
+    "아테네": "athens",
+    "멕시코시티": "mexico city",
+    "리우데자네이루": "rio de janeiro",
+    "부에노스아이레스": "buenos aires",
+    "산티아고": "santiago",
+    "리마": "lima",
+    "케이프타운": "cape town",
+    "마라케시": "marrakesh",
+    "도하": "doha",
+    "서울": "seoul",
+    "부산": "busan",
+    "제주": "jeju",
+    "마카오": "macao",
+    "프놈펜": "phnom penh",
+    "시엠립": "siem reap",
+    "양곤": "yangon",
+    "카트만두": "kathmandu",
+    "콜롬보": "colombo",
+    "타슈켄트": "tashkent",
+    "알마티": "almaty",
+    "트빌리시": "tbilisi",
+})
+
+ENTRY_REQUIREMENTS_BY_COUNTRY = _freeze({
+    "일본": {
+        "visa": "90일 이하 무비자",
+        "stay": "최대 90일 체류 가능",
+        "eta": "별도 ESTA/ETA 불필요",
+        "passport": "입국 시 유효한 전자여권 필요 (통상 6개월 이상 권장)",
+    },
+    "중국": {
+        "visa": "일반적으로 비자 필요 (경유/특정 정책 예외 가능)",
+        "stay": "비자 종류에 따라 상이",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "일반적으로 6개월 이상 유효기간 필요",
+    },
+    "대만": {
+        "visa": "90일 이하 무비자",
+        "stay": "최대 90일",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "입국 시 6개월 이상 권장",
+    },
+    "홍콩": {
+        "visa": "90일 이하 무비자",
+        "stay": "최대 90일",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "입국 시 1개월+ 체류기간을 초과하는 유효기간 권장",
+    },
+    "베트남": {
+        "visa": "45일 이하 무비자",
+        "stay": "최대 45일",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "일반적으로 6개월 이상 유효기간 필요",
+    },
+    "태국": {
+        "visa": "무비자 입국 가능",
+        "stay": "정책에 따라 60일 내외 (변동 가능)",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "일반적으로 6개월 이상 유효기간 필요",
+    },
+    "싱가포르": {
+        "visa": "90일 이하 무비자",
+        "stay": "최대 90일",
+        "eta": "전자입국신고(SG Arrival Card) 필요",
+        "passport": "입국 시 6개월 이상 유효기간 필요",
+    },
+    "말레이시아": {
+        "visa": "90일 이하 무비자",
+        "stay": "최대 90일",
+        "eta": "전자입국신고(MDAC) 필요",
+        "passport": "입국 시 6개월 이상 유효기간 필요",
+    },
+    "미국": {
+        "visa": "관광 목적 90일 이하는 ESTA 승인 시 무비자",
+        "stay": "최대 90일 (ESTA 기준)",
+        "eta": "ESTA 필수",
+        "passport": "전자여권 필요 (체류기간 동안 유효)",
+    },
+    "캐나다": {
+        "visa": "단기 체류 시 비자 면제",
+        "stay": "통상 최대 6개월",
+        "eta": "eTA 필수 (항공 입국 시)",
+        "passport": "입국 시 유효한 여권 필요",
+    },
+    "영국": {
+        "visa": "단기 방문 무비자",
+        "stay": "최대 6개월",
+        "eta": "ETA 필요",
+        "passport": "체류기간 동안 유효한 여권 필요",
+    },
+    "프랑스": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "독일": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "이탈리아": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "스페인": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "포르투갈": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "네덜란드": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "크로아티아": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "아이슬란드": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "튀르키예": {
+        "visa": "90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "입국일 기준 150일 이상 권장",
+    },
+    "아랍에미리트": {
+        "visa": "90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "일반적으로 6개월 이상 유효기간 필요",
+    },
+    "호주": {
+        "visa": "비자 필요",
+        "stay": "승인 비자 조건에 따름",
+        "eta": "ETA 또는 eVisitor 사전 신청 필요",
+        "passport": "체류기간 동안 유효한 전자여권 필요",
+    },
+    "뉴질랜드": {
+        "visa": "90일 이하 무비자",
+        "stay": "최대 90일",
+        "eta": "NZeTA 필수",
+        "passport": "출국일 기준 3개월 이상 유효기간 필요",
+    },
+    "몽골": {
+        "visa": "90일 이하 무비자",
+        "stay": "최대 90일",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "일반적으로 6개월 이상 유효기간 필요",
+    },
+    "라오스": {
+        "visa": "무비자 입국 가능",
+        "stay": "통상 30일 내외 (변동 가능)",
+        "eta": "전자비자(eVisa) 선택 가능",
+        "passport": "일반적으로 6개월 이상 유효기간 필요",
+    },
+    "이집트": {
+        "visa": "비자 필요",
+        "stay": "비자 조건에 따름",
+        "eta": "e-Visa 사전 신청 또는 도착비자 가능",
+        "passport": "일반적으로 6개월 이상 유효기간 필요",
+    },
+    "필리핀": {
+        "visa": "30일 이하 무비자",
+        "stay": "최대 30일",
+        "eta": "eTravel 등록 필요",
+        "passport": "입국일 기준 6개월 이상 유효기간 필요",
+    },
+    "인도네시아": {
+        "visa": "단기 관광 시 도착비자(VOA) 또는 e-VOA",
+        "stay": "통상 최대 30일 (연장 가능)",
+        "eta": "전자 세관신고(e-CD) 등 입국 전 절차 확인 권장",
+        "passport": "입국일 기준 6개월 이상 유효기간 필요",
+    },
+    "인도": {
+        "visa": "비자 필요",
+        "stay": "승인 비자 조건에 따름",
+        "eta": "e-Visa 사전 신청 가능",
+        "passport": "입국일 기준 6개월 이상 유효기간 필요",
+    },
+    "스위스": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "오스트리아": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "체코": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "헝가리": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "핀란드": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "노르웨이": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "덴마크": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "벨기에": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "아일랜드": {
+        "visa": "단기 방문 무비자",
+        "stay": "통상 최대 90일",
+        "eta": "향후 ETA 시행 가능, 최신 공지 확인 필요",
+        "passport": "체류기간 동안 유효한 여권 필요",
+    },
+    "멕시코": {
+        "visa": "무비자 입국 가능",
+        "stay": "통상 최대 180일 (심사관 재량)",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "체류기간 동안 유효한 여권 필요",
+    },
+    "스웨덴": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "폴란드": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "그리스": {
+        "visa": "쉥겐 90일 이하 무비자",
+        "stay": "180일 중 최대 90일",
+        "eta": "ESTA/ETA 불필요 (ETIAS 시행 시 변경 가능)",
+        "passport": "출국예정일 기준 3개월 이상 + 발급 후 10년 이내",
+    },
+    "브라질": {
+        "visa": "단기 방문 무비자",
+        "stay": "최대 90일 (연장 가능 여부 별도 확인)",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "입국 시 통상 6개월 이상 유효기간 권장",
+    },
+    "아르헨티나": {
+        "visa": "90일 이하 무비자",
+        "stay": "최대 90일",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "체류기간 동안 유효한 여권 필요",
+    },
+    "칠레": {
+        "visa": "90일 이하 무비자",
+        "stay": "최대 90일",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "체류기간 이상 유효한 여권 필요",
+    },
+    "페루": {
+        "visa": "무비자 입국 가능",
+        "stay": "통상 최대 90일 (입국 심사 재량)",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "입국일 기준 6개월 이상 유효기간 권장",
+    },
+    "남아프리카공화국": {
+        "visa": "90일 이하 무비자",
+        "stay": "최대 90일",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "입국일 기준 30일 이상 + 빈 사증면 필요",
+    },
+    "모로코": {
+        "visa": "90일 이하 무비자",
+        "stay": "최대 90일",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "입국 시 통상 6개월 이상 유효기간 권장",
+    },
+    "카타르": {
+        "visa": "무비자 입국 가능 (입국 시 체류 허가)",
+        "stay": "통상 최대 30일",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "입국 시 통상 6개월 이상 유효기간 필요",
+    },
+    "대한민국": {
+        "visa": "해당 없음 (자국민)",
+        "stay": "해당 없음",
+        "eta": "해당 없음",
+        "passport": "해당 없음",
+    },
+    "마카오": {
+        "visa": "90일 이하 무비자",
+        "stay": "최대 90일",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "입국 시 통상 3개월 이상 유효기간 권장",
+    },
+    "캄보디아": {
+        "visa": "비자 필요 (e-Visa/도착비자 가능)",
+        "stay": "통상 30일",
+        "eta": "e-Arrival Card 등 사전 등록 여부 확인 권장",
+        "passport": "입국 시 6개월 이상 유효기간 필요",
+    },
+    "미얀마": {
+        "visa": "비자 필요 (전자비자 가능 여부 수시 변동)",
+        "stay": "비자 종류 및 승인 조건에 따름",
+        "eta": "전자비자(eVisa) 가능 여부 최신 공지 확인 필요",
+        "passport": "입국 시 6개월 이상 유효기간 필요",
+    },
+    "네팔": {
+        "visa": "도착비자 또는 e-Visa 가능",
+        "stay": "통상 15/30/90일 옵션",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "입국 시 6개월 이상 유효기간 권장",
+    },
+    "스리랑카": {
+        "visa": "전자여행허가(ETA) 사전 신청 필요",
+        "stay": "통상 30일",
+        "eta": "스리랑카 ETA 필요",
+        "passport": "입국 시 통상 6개월 이상 유효기간 필요",
+    },
+    "우즈베키스탄": {
+        "visa": "30일 이하 무비자",
+        "stay": "최대 30일",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "입국 시 통상 6개월 이상 유효기간 권장",
+    },
+    "카자흐스탄": {
+        "visa": "30일 이하 무비자",
+        "stay": "최대 30일",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "입국 시 통상 6개월 이상 유효기간 권장",
+    },
+    "조지아": {
+        "visa": "무비자 입국 가능",
+        "stay": "통상 최대 1년",
+        "eta": "ESTA/ETA 불필요",
+        "passport": "체류기간 동안 유효한 여권 필요",
+    },
+})
+
+REPRESENTATIVE_FOOD_BY_DESTINATION = _freeze({
+    "일본": "라멘",
+    "오사카": "타코야키",
+    "도쿄": "스시",
+    "중국": "샤오룽바오",
+    "대만": "우육면",
+    "홍콩": "딤섬",
+    "베트남": "쌀국수",
+    "태국": "팟타이",
+    "싱가포르": "칠리 크랩",
+    "미국": "바비큐",
+    "프랑스": "크루아상",
+    "이탈리아": "피자",
+    "스페인": "빠에야",
+    "튀르키예": "케밥",
+    "호주": "미트파이",
+    "멕시코": "타코",
+})
+
+ZONE_CLIMATE_STATS = _freeze({
+    "열대몬순": {
+        "temp": [27, 28, 29, 30, 30, 29, 29, 29, 29, 29, 28, 27],
+        "rain": [20, 30, 50, 90, 220, 180, 170, 190, 300, 240, 80, 30],
+        "rainy_season": [5, 6, 7, 8, 9, 10],
+        "typhoon_season": [],
+        "notes": "스콜성 소나기가 잦아 우산/방수 신발이 유용합니다.",
+    },
+    "동아시아해양": {
+        "temp": [6, 7, 11, 16, 21, 24, 28, 29, 25, 20, 14, 8],
+        "rain": [55, 60, 95, 120, 135, 180, 210, 190, 170, 120, 85, 55],
+        "rainy_season": [6, 7],
+        "typhoon_season": [8, 9, 10],
+        "notes": "장마/태풍 시기엔 항공·페리 지연 가능성을 감안해야 합니다.",
+    },
+    "지중해": {
+        "temp": [8, 9, 12, 16, 20, 25, 29, 29, 25, 20, 14, 10],
+        "rain": [80, 70, 60, 55, 40, 20, 8, 15, 40, 85, 95, 90],
+        "rainy_season": [11, 12, 1, 2],
+        "typhoon_season": [],
+        "notes": "여름철은 덥고 건조해 한낮 야외활동 난도가 높습니다.",
+    },
+    "온대대륙": {
+        "temp": [-1, 1, 6, 12, 18, 22, 25, 24, 19, 13, 6, 1],
+        "rain": [45, 40, 45, 55, 70, 75, 70, 65, 55, 50, 50, 45],
+        "rainy_season": [6, 7, 8],
+        "typhoon_season": [],
+        "notes": "겨울엔 결빙/한파, 여름엔 소나기 가능성을 고려하세요.",
+    },
+    "사막": {
+        "temp": [19, 21, 25, 30, 34, 36, 39, 39, 35, 31, 26, 21],
+        "rain": [15, 20, 15, 8, 3, 1, 1, 1, 1, 2, 6, 12],
+        "rainy_season": [],
+        "typhoon_season": [],
+        "notes": "한낮 폭염과 큰 일교차를 감수해야 하며 수분 보충이 중요합니다.",
+    },
+})
+
+COUNTRY_CLIMATE_ZONE = _freeze({
+    "태국": "열대몬순",
+    "베트남": "열대몬순",
+    "싱가포르": "열대몬순",
+    "말레이시아": "열대몬순",
+    "대만": "동아시아해양",
+    "일본": "동아시아해양",
+    "홍콩": "동아시아해양",
+    "중국": "온대대륙",
+    "미국": "온대대륙",
+    "캐나다": "온대대륙",
+    "영국": "온대대륙",
+    "프랑스": "지중해",
+    "이탈리아": "지중해",
+    "스페인": "지중해",
+    "포르투갈": "지중해",
+    "독일": "온대대륙",
+    "네덜란드": "온대대륙",
+    "튀르키예": "지중해",
+    "아랍에미리트": "사막",
+    "호주": "온대대륙",
+    "뉴질랜드": "온대대륙",
+})
+
+THEMEALDB_AREA_BY_COUNTRY = _freeze({
+    "미국": "American",
+    "영국": "British",
+    "캐나다": "Canadian",
+    "중국": "Chinese",
+    "크로아티아": "Croatian",
+    "네덜란드": "Dutch",
+    "이집트": "Egyptian",
+    "프랑스": "French",
+    "인도": "Indian",
+    "아일랜드": "Irish",
+    "이탈리아": "Italian",
+    "말레이시아": "Malaysian",
+    "멕시코": "Mexican",
+    "폴란드": "Polish",
+    "포르투갈": "Portuguese",
+    "러시아": "Russian",
+    "스페인": "Spanish",
+    "태국": "Thai",
+    "튀르키예": "Turkish",
+    "우크라이나": "Ukrainian",
+    "베트남": "Vietnamese",
+    "일본": "Japanese",
+})
+
+REGRET_DESTINATION_TRAITS = _freeze({
+    "쇼핑/도시": ["쇼핑", "야경", "도시", "몰", "백화점", "city", "nightlife"],
+    "휴양/바다": ["휴양", "리조트", "해변", "바다", "비치", "beach"],
+    "관광/유적": ["관광", "유적", "박물관", "역사", "궁전", "성당", "heritage"],
+    "대자연/트레킹": ["대자연", "트레킹", "하이킹", "산", "국립공원", "빙하", "safari"],
+    "미식/로컬푸드": ["미식", "로컬푸드", "야시장", "맛집", "레스토랑", "gourmet"],
+})
+
+REGRET_STYLE_MISMATCH_MESSAGES = _freeze({
+    "휴양/바다 (물놀이)": {
+        "쇼핑/도시": "⚠️ 이 도시는 쇼핑/야경 중심이라 물놀이·휴양 비중이 기대보다 낮을 수 있어요.",
+        "관광/유적": "⚠️ 이 여행지는 역사·도보 관광 비중이 있어 완전 휴양형 여행과는 결이 다를 수 있어요.",
+    },
+    "관광/유적 (많이 걷기)": {
+        "쇼핑/도시": "⚠️ 이 도시는 쇼핑/야경 중심이라 관광지를 많이 보는 스타일과는 맞지 않을 수 있습니다.",
+        "휴양/바다": "⚠️ 휴양 중심 동선이면 유적·역사 탐방 밀도가 낮아 아쉬울 수 있어요.",
+    },
+    "쇼핑/도시": {
+        "대자연/트레킹": "⚠️ 이 목적지는 자연/트레킹 중심이라 쇼핑 인프라가 제한적일 수 있어요.",
+        "휴양/바다": "⚠️ 휴양지 특성상 대형 쇼핑 스폿이 적어 도시형 쇼핑 여행과 결이 다를 수 있어요.",
+    },
+    "대자연/트레킹": {
+        "쇼핑/도시": "⚠️ 도시/쇼핑 비중이 높아 대자연 체험 시간을 충분히 확보하기 어려울 수 있어요.",
+        "휴양/바다": "⚠️ 해변 휴양 중심 일정이면 트레킹 강도가 기대보다 약할 수 있어요.",
+    },
+    "미식/로컬푸드": {
+        "대자연/트레킹": "⚠️ 자연/트레킹 위주 여행지는 식도락 선택지가 제한될 수 있어요.",
+    },
+})
+
+# 아래 순서가 경고 표시 순서입니다: 보편 리스크 → 장거리 이동 → 현지 적응.
+REGRET_KEYWORD_RULES = _freeze([
+    {
+        "keywords": ["스위스", "아이슬란드", "두바이", "런던", "뉴욕", "파리", "싱가포르"],
+        "message": "⚠️ 현지 물가가 높은 편이라 식비·교통비·입장료가 예상보다 커질 수 있어요.",
+    },
+    {
+        "keywords": ["런던", "파리", "암스테르담", "아이슬란드", "영국"],
+        "message": "⚠️ 비·강풍 등 변덕스러운 날씨로 실외 일정이 자주 바뀔 수 있어요.",
+    },
+    {
+        "keywords": ["로마", "바르셀로나", "파리", "방콕"],
+        "message": "⚠️ 관광객이 많은 지역은 소매치기·잡상인 이슈가 있어 동선별 주의가 필요해요.",
+    },
+    {
+        "keywords": ["미국", "캐나다", "영국", "프랑스", "독일", "스페인", "포르투갈", "이탈리아", "아이슬란드"],
+        "message": "⚠️ 장거리 노선은 비행시간이 길고 시차 적응이 필요해, 실제 관광 가능한 시간이 예상보다 줄 수 있어요.",
+    },
+    {
+        "keywords": ["이집트", "크로아티아", "포르투갈", "핀란드", "체코", "헝가리", "오스트리아", "노르웨이"],
+        "message": "⚠️ 출발일/도시 조합에 따라 직항이 없거나 좌석이 적어 경유 대기시간이 길어질 수 있어요.",
+    },
+    {
+        "keywords": ["인도", "이집트", "몽골", "라오스", "베트남", "태국"],
+        "message": "⚠️ 향신료·조리 방식·수질 차이로 음식이 낯설 수 있어 첫날은 무난한 메뉴로 적응하는 편이 안전해요.",
+    },
+    {
+        "keywords": ["두바이", "아랍에미리트", "카이로", "울란바토르"],
+        "message": "⚠️ 기온 편차(한낮 고온/야간 저온)나 건조한 공기로 컨디션이 흔들릴 수 있어 복장/보습 대비가 필요해요.",
+    },
+    {
+        "keywords": ["런던", "암스테르담", "아이슬란드", "뉴질랜드"],
+        "message": "⚠️ 날씨 변동 폭이 큰 지역이라 같은 날에도 비·바람이 반복될 수 있어 실내 대안 동선을 준비해 두세요.",
+    },
+])
+
+REGRET_CITY_SPECIFIC_RISKS = _freeze({
+    "뉴욕": "⚠️ 맨해튼 중심 숙소/교통비가 높아 보이는 예산보다 현지 지출이 빠르게 커질 수 있어요.",
+    "파리": "⚠️ 주요 관광지는 대기줄이 길어 사전 예약이 없으면 하루 동선이 크게 밀릴 수 있어요.",
+    "런던": "⚠️ 지하철 파업·공사 이슈가 간헐적으로 있어 이동 동선 플랜B를 준비하는 것이 좋아요.",
+    "방콕": "⚠️ 출퇴근 시간대 교통체증이 심해, 지도상 거리보다 이동시간이 2배 이상 걸릴 수 있어요.",
+    "도쿄": "⚠️ 러시아워 전철 혼잡도가 높아 캐리어 이동은 피크 시간을 피하는 편이 좋아요.",
+    "로마": "⚠️ 인기 유적지는 휴관일·예약 슬롯 변동이 잦아 일정 확정 전에 운영시간 재확인이 필요해요.",
+})
+
+REGRET_FALLBACK_MESSAGES = _freeze([
+    "⚠️ 성수기에는 항공권·숙소 가격이 급등해 같은 예산으로 체감 퀄리티가 낮아질 수 있어요.",
+    "⚠️ 관광지 오픈시간/휴무일이 수시로 바뀌므로 핵심 스팟은 공식 사이트에서 재확인하세요.",
+    "⚠️ 현지 교통 파업·행사·우천 변수로 당일 동선이 바뀔 수 있어 대체 코스를 미리 정해두는 게 좋아요.",
+])